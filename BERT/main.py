@@ -2,6 +2,16 @@
 # Then, simply execute from your terminal: python this_script_name.py
 
 from manim import *
+import numpy as np
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from components.heatmap import Heatmap, MatrixTransition
+from components.network import LayeredNetwork
+from components.point_cloud import CloudTransition, PointCloud, colors_by_value
+from components.text import cached_text
 
 class ManimBrain(VGroup):
     """A custom VGroup that creates a stylized brain icon."""
@@ -22,6 +32,7 @@ class BERTBreakthrough(Scene):
         self.show_title_screen()
         self.show_unidirectional_problem()
         self.show_bert_architecture()
+        self.show_contextual_embeddings()
         self.show_masked_language_model()
         self.show_next_sentence_prediction()
         self.show_fine_tuning_power()
@@ -30,7 +41,7 @@ class BERTBreakthrough(Scene):
     def show_title_screen(self):
         # Add "Let's Understand" above BERT
         lets_understand = Text("Let's Understand", font_size=48, color=WHITE).move_to(UP*1.5)
-        title = Text("BERT", font_size=120, weight=BOLD).set_color_by_gradient(BLUE_C, PURPLE_B)
+        title = cached_text("BERT", font_size=120, weight=BOLD).set_color_by_gradient(BLUE_C, PURPLE_B)
         full_form = Text("Bidirectional Encoder Representations from Transformers", font_size=32).next_to(title, DOWN, buff=0.5)
         
         self.play(FadeIn(lets_understand, shift=UP))
@@ -111,31 +122,85 @@ class BERTBreakthrough(Scene):
         title = Text("BERT's Revolutionary Architecture", font_size=36).to_edge(UP, buff=0.5)
         self.play(Write(title))
         
-        # Create transformer layers visualization
-        layers = VGroup()
-        for i in range(3):
-            layer = Rectangle(width=6, height=0.8, color=BLUE_B, fill_opacity=0.3)
-            layer_text = Text(f"Transformer Layer {i+1}", font_size=18).move_to(layer)
-            layer_group = VGroup(layer, layer_text)
-            layers.add(layer_group)
-        
-        layers.arrange(UP, buff=0.3).move_to(ORIGIN)
+        # The real stacks, every head connected to every head of the next layer
+        # (BERT-Large has 23 × 16² = 5888 such edges, all in one path)
+        base = LayeredNetwork(12, 12, 768, width=4.2, height=3.6)
+        large = LayeredNetwork(24, 16, 1024, width=4.2, height=3.6, max_edges=6000)
+        base.move_to(LEFT * 3.2 + UP * 0.2)
+        large.move_to(RIGHT * 3.4 + UP * 0.2)
+        layers = VGroup(base, large)
+        layer_labels = VGroup(base.layer_labels(font_size=12), large.layer_labels(font_size=12))
+        model_labels = VGroup(
+            Text("BERT-Base: 12 layers × 12 heads × 768", font_size=18).next_to(base, DOWN, buff=0.3),
+            Text("BERT-Large: 24 layers × 16 heads × 1024", font_size=18).next_to(large, DOWN, buff=0.3),
+        )
         
         # Add bidirectional arrows
-        bidirectional_arrows = VGroup()
-        for i in range(len(layers)-1):
-            up_arrow = Arrow(layers[i].get_top(), layers[i+1].get_bottom(), color=GREEN, stroke_width=3)
-            down_arrow = Arrow(layers[i+1].get_bottom(), layers[i].get_top(), color=GREEN, stroke_width=3)
-            bidirectional_arrows.add(up_arrow, down_arrow)
-        
-        self.play(LaggedStart(*[FadeIn(layer, shift=UP) for layer in layers], lag_ratio=0.3))
+        bidirectional_arrows = VGroup(*[
+            DoubleArrow(network.get_corner(DR) + RIGHT * 0.25, network.get_corner(UR) + RIGHT * 0.25,
+                        color=GREEN, stroke_width=3, buff=0)
+            for network in layers
+        ])
+        
+        self.play(LaggedStart(*[FadeIn(network.nodes, shift=UP) for network in layers], lag_ratio=0.3),
+                  FadeIn(layer_labels), FadeIn(model_labels))
+        self.play(*[Create(network.edges) for network in layers], run_time=1.5)
         self.play(LaggedStart(*[Create(arrow) for arrow in bidirectional_arrows], lag_ratio=0.1))
         
-        caption = Text("Each layer can see information from ALL directions", font_size=24, color=GREEN).next_to(layers, DOWN, buff=0.8)
+        caption = Text("Each layer can see information from ALL directions", font_size=24, color=GREEN).next_to(model_labels, DOWN, buff=0.5)
         self.play(Write(caption))
         
         self.wait(2)
-        self.play(FadeOut(title, layers, bidirectional_arrows, caption))
+        self.play(FadeOut(title, layers, layer_labels, model_labels, bidirectional_arrows, caption))
+
+    def show_contextual_embeddings(self):
+        title = Text("Embeddings Become Contextual Layer by Layer", font_size=34).to_edge(UP, buff=0.5)
+        self.play(Write(title))
+
+        # 20,000 token occurrences of 60 words, each word used in one of three senses
+        num_tokens, num_words, num_senses = 20000, 60, 3
+        rng = np.random.default_rng(7)
+        word_ids = np.minimum(rng.zipf(1.5, num_tokens) - 1, num_words - 1)
+        sense_ids = rng.integers(0, num_senses, num_tokens)
+        token_colors = colors_by_value(word_ids, [BLUE, GREEN, YELLOW, RED])
+
+        cloud = PointCloud(self.embedding_projection(word_ids, sense_ids, 0, rng), token_colors, stroke_width=1)
+        layer_label = Text("Layer 0 (input embeddings)", font_size=22).to_edge(DOWN, buff=0.6)
+        caption = Text("Every occurrence of a word starts at the same point", font_size=20, color=GRAY)
+        caption.next_to(layer_label, UP, buff=0.2)
+
+        self.play(FadeIn(cloud), Write(layer_label), FadeIn(caption))
+        self.wait(1)
+
+        next_caption = Text("Deeper layers separate occurrences by their context", font_size=20, color=GRAY)
+        next_caption.move_to(caption)
+        self.play(Transform(caption, next_caption))
+        for layer in [4, 8, 12]:
+            next_label = Text(f"Layer {layer}", font_size=22).move_to(layer_label)
+            self.play(
+                CloudTransition(cloud, self.embedding_projection(word_ids, sense_ids, layer, rng)),
+                Transform(layer_label, next_label),
+                run_time=2
+            )
+            self.wait(0.5)
+
+        self.wait(1.5)
+        self.play(FadeOut(title, cloud, layer_label, caption))
+
+    def embedding_projection(self, word_ids, sense_ids, layer, rng, num_layers=12):
+        """Illustrative 2-D projection of token embeddings at ``layer``, in scene coordinates.
+
+        At layer 0 every occurrence of a word sits on the word's point; with
+        depth the occurrences drift apart into one cluster per sense.
+        """
+        depth = layer / num_layers
+        word_angles = word_ids * 2.399963  # golden angle: words spread evenly over a disc
+        word_radii = 2.6 * np.sqrt((word_ids + 0.5) / (word_ids.max() + 1))
+        centers = np.stack([word_radii * np.cos(word_angles) * 1.6, word_radii * np.sin(word_angles)], axis=1)
+        sense_angles = word_angles + sense_ids * (2 * PI / 3)
+        offsets = np.stack([np.cos(sense_angles), np.sin(sense_angles)], axis=1) * 0.45 * depth
+        noise = rng.normal(0, 0.03 + 0.12 * depth, centers.shape)
+        return (centers + offsets + noise + [0, 0.2]).astype(np.float32)
 
     def show_masked_language_model(self):
         title = Text("BERT's Masked Language Model", font_size=36).to_edge(UP, buff=0.5)
@@ -167,7 +232,7 @@ class BERTBreakthrough(Scene):
         # Mask the word "large" (index 5)
         target_word = word_objects[5]  # "large"
         original_text = target_word.text
-        mask_token = Text("[MASK]", color=YELLOW, weight=BOLD, font_size=22)
+        mask_token = cached_text("[MASK]", font_size=22, weight=BOLD, color=YELLOW)
         mask_token.match_height(target_word)  # Ensures same height as original word
         mask_token.move_to(target_word.get_center())
         
@@ -242,6 +307,58 @@ class BERTBreakthrough(Scene):
         self.play(FadeOut(title, sentence_group, mask_token, caption1))
         self.wait(0.5)
 
+        # Inside the encoder: attention maps over a 128-token input, across layers and heads
+        attention_title = Text("Attention Across Layers and Heads", font_size=32).to_edge(UP, buff=0.5)
+        sequence_length = 128
+        heatmap = Heatmap(self.attention_map(sequence_length, layer=0, head=0), height=5.5)
+        heatmap.next_to(attention_title, DOWN, buff=0.4)
+        head_label = Text("Layer 1 · Head 1", font_size=22).next_to(heatmap, RIGHT, buff=0.6)
+        length_label = Text(f"{sequence_length} x {sequence_length} tokens", font_size=18, color=GRAY)
+        length_label.next_to(head_label, DOWN, buff=0.3)
+
+        self.play(Write(attention_title), FadeIn(heatmap), FadeIn(head_label, length_label))
+        self.wait(0.5)
+
+        for layer, head in [(0, 2), (4, 0), (8, 1), (11, 0)]:
+            next_label = Text(f"Layer {layer + 1} · Head {head + 1}", font_size=22).move_to(head_label)
+            self.play(
+                MatrixTransition(heatmap, self.attention_map(sequence_length, layer, head)),
+                Transform(head_label, next_label),
+                run_time=1.5
+            )
+            self.wait(0.5)
+
+        # Zoom in on the masked sentence: token labels appear once cells are readable
+        tokens = ["[CLS]", "The", "model", "was", "trained", "on", "[MASK]", "datasets", "[SEP]"]
+        zoom_box = Square(
+            side_length=heatmap.cell_size * len(tokens), color=YELLOW, stroke_width=3
+        ).move_to(heatmap.get_corner(UL), aligned_edge=UL)
+        # The column labels need the space the title occupies
+        self.play(FadeOut(attention_title), Create(zoom_box))
+        self.remove(zoom_box)
+        heatmap.set_matrix(heatmap.values[:len(tokens), :len(tokens)])
+        token_labels = heatmap.token_labels(tokens, font_size=16)
+        self.play(FadeIn(token_labels, lag_ratio=0.05))
+        self.wait(2)
+
+        self.play(FadeOut(heatmap, head_label, length_label, token_labels))
+        self.wait(0.5)
+
+    def attention_map(self, size, layer, head, num_layers=12):
+        """Illustrative attention weights for one layer and head, scaled so each row peaks at 1.
+
+        Early layers attend to nearby tokens (each head with its own offset);
+        deeper layers spread out and pool into [CLS].
+        """
+        rng = np.random.default_rng(layer * 16 + head)
+        depth = layer / (num_layers - 1)
+        positions = np.arange(size)
+        distance = np.abs(positions[None, :] - positions[:, None] - (head % 3 - 1))
+        logits = -distance / (1 + depth * size / 8) + rng.normal(0, 0.3 + depth, (size, size))
+        logits[:, 0] += 4 * depth
+        weights = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return weights / weights.max(axis=1, keepdims=True)
+
     def show_next_sentence_prediction(self):
         title = Text("Next Sentence Prediction Task", font_size=36).to_edge(UP, buff=0.5)
         self.play(Write(title))
@@ -377,7 +494,7 @@ class BERTBreakthrough(Scene):
         bi_concept = VGroup(bi_icon, bi_text)
         
         # Masking concept
-        mask_icon = Text("[MASK]", color=YELLOW, weight=BOLD, font_size=20)
+        mask_icon = cached_text("[MASK]", font_size=20, weight=BOLD, color=YELLOW)
         mask_text = Text("Masked Language\nModeling", font_size=18).next_to(mask_icon, DOWN, buff=0.2)
         mask_concept = VGroup(mask_icon, mask_text)
         
@@ -402,7 +519,7 @@ class BERTBreakthrough(Scene):
         self.play(LaggedStart(*[FadeIn(concept, shift=UP) for concept in concepts], lag_ratio=0.3))
         
         # Final BERT logo
-        final_logo = Text("BERT", font_size=120, weight=BOLD).set_color_by_gradient(BLUE_C, PURPLE_B)
+        final_logo = cached_text("BERT", font_size=120, weight=BOLD).set_color_by_gradient(BLUE_C, PURPLE_B)
         final_caption = Text("Transforming Natural Language Understanding", slant=ITALIC, font_size=24).next_to(final_logo, DOWN, buff=0.4)
         final_group = VGroup(final_logo, final_caption)
         
@@ -1,6 +1,14 @@
 from manim import *
 import numpy as np
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from components.charts import ChartTransition, GroupedBarChart
+from components.grpo import simulate_grpo
+from components.text import cached_text
+
 # Configuration for high-quality output
 config.pixel_height = 1080
 config.pixel_width = 1920
@@ -16,20 +24,26 @@ ACCENT_ORANGE = "#F59E0B"
 ACCENT_RED = "#EF4444"
 ACCENT_PURPLE = "#8B5CF6"
 
+# Size of the simulated GRPO run in grpo_simulation
+GRPO_PROMPTS = 256
+GRPO_GROUP_SIZE = 512
+GRPO_STEPS = 60
+
 class DeepSeekR1Animation(Scene):
     def construct(self):
         """
-        One-minute animation showcasing DeepSeek-R1's revolutionary approach.
-        Five scenes, 12 seconds each, focusing on key technical innovations.
+        Animation of about a minute and a quarter showcasing DeepSeek-R1's revolutionary approach.
+        Six scenes, about 12 seconds each, focusing on key technical innovations.
         """
         self.camera.background_color = "#F8FAFC"
         
-        # Execute five focused scenes
+        # Execute six focused scenes
         self.paradigm_shift()         # 0-12s: Traditional vs Pure RL
         self.grpo_algorithm()         # 12-24s: GRPO mechanism  
-        self.aha_moment()            # 24-36s: Emergent metacognition
-        self.training_pipeline()     # 36-48s: Four-stage process
-        self.performance_results()   # 48-60s: Results and impact
+        self.grpo_simulation()        # 24-36s: GRPO over many prompts and large groups
+        self.aha_moment()            # 36-48s: Emergent metacognition
+        self.training_pipeline()     # 48-60s: Four-stage process
+        self.performance_results()   # 60-72s: Results and impact
     
     def paradigm_shift(self):
         """Scene 1: Traditional supervised learning vs pure RL paradigm - FIXED"""
@@ -49,9 +63,9 @@ class DeepSeekR1Animation(Scene):
         
         trad_pipeline = VGroup(
             self.create_pipeline_box("Massive Datasets", ACCENT_RED, reduced_size=True),
-            Text("↓", font_size=20, color=ACCENT_RED),
+            cached_text("↓", font_size=20, color=ACCENT_RED),
             self.create_pipeline_box("Supervised Fine-tuning", ACCENT_RED, reduced_size=True),
-            Text("↓", font_size=20, color=ACCENT_RED),
+            cached_text("↓", font_size=20, color=ACCENT_RED),
             self.create_pipeline_box("Limited RL", ACCENT_RED, reduced_size=True)
         )
         trad_pipeline.arrange(DOWN, buff=0.2)  # Reduced spacing
@@ -63,9 +77,9 @@ class DeepSeekR1Animation(Scene):
         
         deepseek_pipeline = VGroup(
             self.create_pipeline_box("Base Model", DEEPSEEK_BLUE, reduced_size=True),
-            Text("↓", font_size=20, color=DEEPSEEK_BLUE),
+            cached_text("↓", font_size=20, color=DEEPSEEK_BLUE),
             self.create_pipeline_box("Pure RL Training", DEEPSEEK_BLUE, reduced_size=True),
-            Text("↓", font_size=20, color=DEEPSEEK_BLUE),
+            cached_text("↓", font_size=20, color=DEEPSEEK_BLUE),
             self.create_pipeline_box("Reasoning Emergence", DEEPSEEK_BLUE, reduced_size=True)
         )
         deepseek_pipeline.arrange(DOWN, buff=0.2)  # Reduced spacing
@@ -169,8 +183,86 @@ class DeepSeekR1Animation(Scene):
         self.play(FadeOut(grpo_elements))
         self.wait(0.3)
     
+    def grpo_simulation(self):
+        """Scene 3: Reward and advantage distributions of a simulated GRPO run"""
+        self.clear()
+        
+        sim_title = Text(f"GRPO at Scale: {GRPO_PROMPTS} Prompts × {GRPO_GROUP_SIZE} Responses Each", 
+                        font_size=30, color=DEEPSEEK_BLUE, weight=BOLD)
+        sim_title.to_edge(UP, buff=0.8)
+        
+        self.play(FadeIn(sim_title))
+        self.wait(0.5)
+        
+        history = simulate_grpo(GRPO_PROMPTS, GRPO_GROUP_SIZE, GRPO_STEPS)
+        reward_levels = (history.reward_edges[1:] + history.reward_edges[:-1]) / 2
+        
+        # Histograms: one batched bar path each, resized in place every frame
+        reward_chart = GroupedBarChart(
+            history.reward_counts[0][:, None], [f"{level:g}" for level in reward_levels],
+            colors=[DEEPSEEK_TEAL], vertical=True, bar_length=3.5, max_value=1,
+            bar_height=0.6, group_spacing=0.8, stroke_width=1,
+            group_label_x=-0.3, group_font_size=16, group_color=DEEPSEEK_DARK
+        )
+        reward_chart.shift(LEFT * 5.5 + DOWN * 1.8)
+        
+        bin_width = 0.2
+        advantage_chart = GroupedBarChart(
+            history.advantage_counts[0][:, None], colors=[ACCENT_PURPLE], vertical=True,
+            bar_length=3.5, max_value=history.advantage_counts.max(),
+            bar_height=bin_width * 0.9, group_spacing=bin_width, stroke_width=1
+        )
+        advantage_chart.shift(LEFT * 0.5 + DOWN * 1.8)
+        
+        # Advantage axis ticks, placed by bin coordinate
+        low, high = history.advantage_edges[0], history.advantage_edges[-1]
+        bins = len(history.advantage_edges) - 1
+        advantage_ticks = VGroup()
+        for value in (low, 0, high):
+            x = advantage_chart.anchor.get_x() + ((value - low) / (high - low) * bins - 0.5) * bin_width
+            advantage_ticks.add(cached_text(f"{value:g}", font_size=16, color=DEEPSEEK_DARK, weight=BOLD)
+                                .move_to([x, reward_chart.anchor.get_y() - 0.3, 0]))
+        
+        reward_caption = Text("Reward r_i (accuracy + format)", font_size=18, color=DEEPSEEK_TEAL, weight=BOLD)
+        reward_caption.next_to(reward_chart, DOWN, buff=0.3)
+        advantage_caption = Text("Advantage A_i within each group", font_size=18, color=ACCENT_PURPLE, weight=BOLD)
+        advantage_caption.next_to(advantage_ticks, DOWN, buff=0.3)
+        
+        step_label = Text(f"Step 0  •  mean reward {history.mean_reward[0]:.2f}", 
+                         font_size=20, color=DEEPSEEK_DARK)
+        step_label.next_to(sim_title, DOWN, buff=0.5)
+        
+        self.play(
+            FadeIn(reward_chart), FadeIn(advantage_chart), FadeIn(advantage_ticks),
+            FadeIn(reward_caption), FadeIn(advantage_caption), FadeIn(step_label)
+        )
+        self.wait(0.5)
+        
+        # Training steps: bars follow the histograms of the simulated run
+        for step in np.linspace(0, GRPO_STEPS - 1, 6).astype(int)[1:]:
+            next_label = Text(f"Step {step}  •  mean reward {history.mean_reward[step]:.2f}", 
+                             font_size=20, color=DEEPSEEK_DARK)
+            next_label.move_to(step_label)
+            self.play(
+                ChartTransition(reward_chart, history.reward_counts[step]),
+                ChartTransition(advantage_chart, history.advantage_counts[step]),
+                Transform(step_label, next_label),
+                run_time=1.2
+            )
+        
+        note = Text("Groups where every response scores the same get zero advantage", 
+                   font_size=16, color=ACCENT_GREEN, weight=BOLD)
+        note.to_edge(DOWN, buff=0.4)
+        self.play(Write(note))
+        self.wait(2)
+        
+        sim_elements = VGroup(sim_title, reward_chart, advantage_chart, advantage_ticks, 
+                             reward_caption, advantage_caption, step_label, note)
+        self.play(FadeOut(sim_elements))
+        self.wait(0.3)
+    
     def aha_moment(self):
-        """Scene 3: Emergent meta-cognitive reasoning phenomenon"""
+        """Scene 4: Emergent meta-cognitive reasoning phenomenon"""
         self.clear()
         
         # Scene title
@@ -227,7 +319,7 @@ class DeepSeekR1Animation(Scene):
         self.wait(0.3)
     
     def training_pipeline(self):
-        """Scene 4: Four-stage training process - FIXED OVERLAPPING AND ARROWS"""
+        """Scene 5: Four-stage training process - FIXED OVERLAPPING AND ARROWS"""
         self.clear()
         
         # Pipeline title
@@ -261,7 +353,7 @@ class DeepSeekR1Animation(Scene):
             stage_box.move_to(LEFT * 6 + RIGHT * i * x_spacing + UP * 0.5)
             
             # Stage labels with adjusted font sizes
-            num_text = Text(stage_num, font_size=13, color=color, weight=BOLD)
+            num_text = cached_text(stage_num, font_size=13, weight=BOLD, color=color)
             name_text = Text(stage_name, font_size=15, color=color, weight=BOLD)
             desc_text = Text(description, font_size=11, color=DEEPSEEK_DARK, line_spacing=1.1)
             
@@ -304,7 +396,7 @@ class DeepSeekR1Animation(Scene):
         self.wait(0.3)
     
     def performance_results(self):
-        """Scene 5: Breakthrough results and distillation impact"""
+        """Scene 6: Breakthrough results and distillation impact"""
         self.clear()
         
         # Results title
@@ -315,31 +407,24 @@ class DeepSeekR1Animation(Scene):
         self.play(FadeIn(results_title))
         self.wait(0.8)
         
-        # Performance comparison with verified data
-        benchmarks = [
-            ("AIME 2024", [79.8, 79.2], ["DeepSeek-R1", "OpenAI o1-1217"]),
-            ("MATH-500", [97.3, 96.4], ["DeepSeek-R1", "OpenAI o1-1217"]),
-            ("Codeforces", [96.3, 96.6], ["DeepSeek-R1", "OpenAI o1-1217"])
-        ]
+        # Performance comparison with verified data (rows: benchmarks, columns: models)
+        benchmarks = ["AIME 2024", "MATH-500", "Codeforces"]
+        models = ["DeepSeek-R1", "OpenAI o1-1217"]
+        scores = np.array([
+            [79.8, 79.2],
+            [97.3, 96.4],
+            [96.3, 96.6],
+        ])
         
         # Create performance chart
-        chart_y = UP * 1.2
-        for i, (benchmark, scores, models) in enumerate(benchmarks):
-            bench_title = Text(benchmark, font_size=16, color=DEEPSEEK_BLUE, weight=BOLD)
-            bench_title.move_to(LEFT * 5 + chart_y + DOWN * i * 1.2)
-            
-            # Performance bars
-            for j, (score, model) in enumerate(zip(scores, models)):
-                bar_width = (score / 100) * 3
-                bar_color = DEEPSEEK_TEAL if j == 0 else ACCENT_ORANGE
-                
-                bar = Rectangle(width=bar_width, height=0.3, color=bar_color, fill_opacity=0.7)
-                bar.move_to(LEFT * 2 + RIGHT * bar_width/2 + chart_y + DOWN * i * 1.2 + DOWN * j * 0.4)
-                
-                score_label = Text(f"{score:.1f}%", font_size=12, color=WHITE, weight=BOLD)
-                score_label.move_to(bar.get_center())
-                
-                self.add(bench_title, bar, score_label)
+        chart = GroupedBarChart(
+            scores, benchmarks, models, colors=[DEEPSEEK_TEAL, ACCENT_ORANGE],
+            bar_length=3, max_value=100, bar_height=0.3, series_spacing=0.4, group_spacing=1.2,
+            group_font_size=16, group_color=DEEPSEEK_BLUE,
+            value_labels="inside", value_format="{:.1f}%", value_font_size=12, value_color=WHITE
+        )
+        chart.shift(LEFT * 2 + UP * 1.2)
+        self.add(chart)
         
         # Distillation success
         distillation_title = Text("Distillation Success", font_size=20, color=DEEPSEEK_TEAL, weight=BOLD)
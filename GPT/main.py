@@ -1,6 +1,17 @@
 from manim import *
 import numpy as np
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from components.loss_curve import LossCurve, RevealCurve, read_log
+from components.network import LayeredNetwork
+from components.text import cached_text
+
+# Pre-training loss logs (relative to this script), shown in training_process when present
+LOSS_LOGS = ("logs/pretrain_loss.npy", "logs/pretrain_loss.csv")
+
 # Configuration for 720p output
 config.pixel_height = 720
 config.pixel_width = 1280
@@ -88,7 +99,7 @@ class GPTPaperAnimation(Scene):
         
         problem_list = VGroup()
         for i, problem in enumerate(problems):
-            bullet = Text("•", font_size=28, color=YELLOW)
+            bullet = cached_text("•", font_size=28, color=YELLOW)
             problem_text = Text(problem, font_size=24, color=WHITE)
             
             problem_row = VGroup(bullet, problem_text)
@@ -256,37 +267,30 @@ class GPTPaperAnimation(Scene):
         
         # Input tokens
         input_text = Text("Input: \"The cat sat on\"", font_size=16, color=GREEN)
-        input_text.move_to(base_pos + DOWN * 1.5)
-        
-        # Transformer layers (simplified)
-        layers = VGroup()
-        for i in range(3):
-            layer = Rectangle(width=2.5, height=0.5, color=BLUE, fill_opacity=0.2)
-            layer_text = Text(f"Layer {i+1}", font_size=14, color=WHITE)
-            layer_group = VGroup(layer, layer_text)
-            layers.add(layer_group)
         
-        layers.arrange(UP, buff=0.15)
-        layers.move_to(base_pos)
+        # The full stack: 12 layers × 12 heads × 768 hidden units, fully connected
+        network = LayeredNetwork(12, 12, 768, width=3.2, height=2.4)
+        network.move_to(base_pos)
+        layer_labels = network.layer_labels(font_size=12, color=GRAY)
+        input_text.next_to(network, DOWN, buff=0.35)
         
         # Output
         output_text = Text("Output: \"mat\"", font_size=16, color=RED)
-        output_text.move_to(base_pos + UP * 1.5)
+        output_text.next_to(network, UP, buff=0.35)
         
         # Animation
         self.play(FadeIn(input_text, shift=UP))
         self.wait(0.5)
         
-        for layer in layers:
-            self.play(FadeIn(layer, shift=UP))
-            self.wait(0.3)
+        self.play(FadeIn(network.nodes, shift=UP), FadeIn(layer_labels))
+        self.play(Create(network.edges), run_time=1.5)
         
         self.wait(0.5)
         self.play(FadeIn(output_text, shift=UP))
         self.wait(1)
         
         # Clear the visual
-        transformer_visual = VGroup(input_text, layers, output_text)
+        transformer_visual = VGroup(input_text, network, layer_labels, output_text)
         self.play(FadeOut(transformer_visual))
     
     def training_process(self):
@@ -348,6 +352,51 @@ class GPTPaperAnimation(Scene):
         )
         self.play(FadeOut(training_objects))
         self.wait(0.5)
+        self.show_loss_curve()
+
+    def show_loss_curve(self):
+        """Pre-training loss from a local log, if there is one"""
+        logs = [Path(__file__).parent / name for name in LOSS_LOGS]
+        log = next((path for path in logs if path.exists()), None)
+        if log is None:
+            return
+        steps, losses = read_log(log)
+        last_step = float(steps[-1])
+        low, high = float(np.min(losses)), float(np.max(losses))
+
+        loss_title = Text("Pre-training Loss", font_size=32, color=ORANGE, weight=BOLD)
+        loss_title.to_edge(UP, buff=1)
+
+        axes = Axes(
+            x_range=[0, last_step, last_step / 5],
+            y_range=[low, high, (high - low) / 4],
+            x_length=9,
+            y_length=4,
+            axis_config={"color": GRAY, "include_tip": False}
+        )
+        axes.next_to(loss_title, DOWN, buff=0.5)
+        x_label = Text("step", font_size=18, color=GRAY).next_to(axes.x_axis, DOWN, buff=0.2)
+        y_label = Text("loss", font_size=18, color=GRAY).next_to(axes.y_axis, LEFT, buff=0.2)
+
+        curve = LossCurve(axes, steps, losses, color=BLUE, stroke_width=3).reveal(0)
+        head = Dot(radius=0.06, color=YELLOW).add_updater(lambda dot: dot.move_to(curve.get_end()))
+        summary = Text(
+            f"{len(losses):,} logged steps  •  final loss {losses[-1]:.3f}",
+            font_size=20,
+            color=WHITE
+        )
+        summary.next_to(axes, DOWN, buff=0.6)
+
+        self.play(FadeIn(loss_title, shift=DOWN))
+        self.play(Create(axes), FadeIn(x_label, y_label))
+        self.add(head)
+        self.play(RevealCurve(curve, run_time=5))
+        head.clear_updaters()
+        self.play(Write(summary))
+        self.wait(2)
+
+        self.play(FadeOut(VGroup(loss_title, axes, x_label, y_label, curve, head, summary)))
+        self.wait(0.5)
     
     def key_results(self):
         """Improved results section for 720p"""
@@ -478,7 +527,7 @@ class GPTPaperAnimation(Scene):
         
         takeaway_group = VGroup()
         for takeaway in takeaways:
-            bullet = Text("•", font_size=28, color=YELLOW, weight=BOLD)
+            bullet = cached_text("•", font_size=28, weight=BOLD, color=YELLOW)
             # Reduced font size to ensure text fits within 720p frame
             takeaway_text = Text(takeaway, font_size=22, color=WHITE)
             
@@ -1,6 +1,14 @@
 from manim import *
 import numpy as np
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from components.charts import GroupedBarChart
+from components.text import cached_text
+from components.token_grid import SweepCells, TokenGrid
+
 # Configuration for high-quality output
 config.pixel_height = 1080
 config.pixel_width = 1920
@@ -414,45 +422,49 @@ class LlamaThreeAnimation(Scene):
         self.play(FadeIn(context_title))
         self.wait(1)
         
-        # Expansion stages
+        # Expansion stages: label, stage, window size in tokens
         stages = [
-            ("8K", "Base Training", 1),
-            ("16K", "Stage 1", 2),
-            ("32K", "Stage 2", 3),
-            ("64K", "Stage 3", 4),
-            ("128K", "Final Stage", 5)
+            ("8K", "Base Training", 8192),
+            ("16K", "Stage 1", 16384),
+            ("32K", "Stage 2", 32768),
+            ("64K", "Stage 3", 65536),
+            ("128K", "Final Stage", 131072)
         ]
         
-        # Create progression bars
-        base_width = 0.5
-        stage_bars = VGroup()
-        stage_labels = VGroup()
-        
-        for i, (size, stage, multiplier) in enumerate(stages):
-            bar_width = base_width * multiplier
-            
-            bar = Rectangle(
-                width=bar_width, 
-                height=0.6, 
-                color=META_BLUE, 
-                fill_opacity=0.7
+        # One cell per token of the final 128K window, drawn as a single image
+        token_grid = TokenGrid(stages[-1][2], columns=512, height=3.2, color="#DDE3EA")
+        token_grid.move_to(LEFT * 3 + DOWN * 0.4)
+        grid_caption = cached_text("1 cell = 1 token  •  131,072 cells", font_size=14, color=DARK_GRAY)
+        grid_caption.next_to(token_grid, DOWN, buff=0.25)
+        
+        window_label = Text("Context: 0 tokens", font_size=20, color=META_BLUE, weight=BOLD)
+        window_label.next_to(token_grid, UP, buff=0.3)
+        
+        self.play(FadeIn(token_grid), FadeIn(grid_caption), FadeIn(window_label))
+        
+        # Animate expansion: the window fills the grid stage by stage
+        filled = 0
+        for size, stage, tokens in stages:
+            next_label = Text(f"Context: {size} tokens ({stage})", font_size=20, color=META_BLUE, weight=BOLD)
+            next_label.move_to(window_label)
+            self.play(
+                SweepCells(token_grid, filled, tokens, META_BLUE, rate_func=linear),
+                Transform(window_label, next_label),
+                run_time=0.8
             )
-            bar.move_to(DOWN * (i - 2) * 1.2 + LEFT * 3)
-            
-            size_label = Text(size, font_size=20, color=WHITE, weight=BOLD)
-            size_label.move_to(bar.get_center())
-            
-            stage_label = Text(stage, font_size=16, color=META_TEAL)
-            stage_label.next_to(bar, RIGHT, buff=0.5)
-            
-            stage_bars.add(bar)
-            stage_labels.add(VGroup(size_label, stage_label))
+            self.wait(0.3)
+            filled = tokens
         
-        # Animate expansion
-        for i, (bar, label) in enumerate(zip(stage_bars, stage_labels)):
-            self.play(GrowFromEdge(bar, LEFT), run_time=0.8)
-            self.play(FadeIn(label), run_time=0.3)
-            self.wait(0.2)
+        # Attention span of the newest token: every earlier token in the window
+        span_caption = cached_text("Newest token attends to the full 128K window", font_size=14, color=ACCENT_ORANGE)
+        span_caption.move_to(grid_caption)
+        self.play(
+            SweepCells(token_grid, 0, filled, ACCENT_ORANGE, opacity=0.45),
+            FadeOut(grid_caption),
+            FadeIn(span_caption),
+            run_time=1.2
+        )
+        self.wait(0.3)
         
         # Training strategy
         strategy_title = Text("Staged Training Strategy", font_size=24, color=META_TEAL, weight=BOLD)
@@ -502,7 +514,7 @@ class LlamaThreeAnimation(Scene):
         
         # Scene cleanup
         context_elements = VGroup(
-            context_title, stage_bars, stage_labels, strategy_title,
+            context_title, token_grid, window_label, span_caption, strategy_title,
             strategy_list, applications_title, app_list
         )
         self.play(FadeOut(context_elements))
@@ -518,59 +530,30 @@ class LlamaThreeAnimation(Scene):
         self.play(FadeIn(results_title))
         self.wait(1)
         
-        # Benchmark data with proper spacing
-        benchmarks = [
-            ("MMLU", [85.2, 83.1, 79.3], ["Llama 3 405B", "GPT-4", "Llama 3 70B"]),
-            ("HumanEval", [89.0, 87.2, 80.5], ["Llama 3 405B", "GPT-4", "Llama 3 70B"]),
-            ("MATH", [73.8, 72.6, 64.2], ["Llama 3 405B", "GPT-4", "Llama 3 70B"])
-        ]
-        
-        # Create charts with proper bar spacing
-        chart_y_start = UP * 1
-        chart_spacing = 2.2  # Increased spacing to prevent overlap
-        
-        all_chart_elements = VGroup()
+        # Benchmark data: one row per benchmark, one column per model
+        benchmarks = ["MMLU", "HumanEval", "MATH"]
+        models = ["Llama 3 405B", "GPT-4", "Llama 3 70B"]
+        scores = np.array([
+            [85.2, 83.1, 79.3],
+            [89.0, 87.2, 80.5],
+            [73.8, 72.6, 64.2],
+        ])
+        
+        # All bars in one chart; each model's bars are a single batched path
+        chart = GroupedBarChart(
+            scores, benchmarks, models, colors=[META_BLUE, ACCENT_ORANGE, META_TEAL],
+            bar_length=4, bar_height=0.35, series_spacing=0.8, group_spacing=2.2,
+            group_color=META_BLUE, series_labels=True, value_labels="end"
+        )
+        chart.shift(LEFT * 3 + UP * 1)
         
-        for i, (benchmark, scores, models) in enumerate(benchmarks):
-            chart_y = chart_y_start + DOWN * i * chart_spacing
-            
-            bench_title = Text(benchmark, font_size=20, color=META_BLUE, weight=BOLD)
-            bench_title.move_to(LEFT * 6 + chart_y)
-            
-            # Create bars with increased vertical spacing
-            bars = VGroup()
-            labels = VGroup()
-            
-            colors = [META_BLUE, ACCENT_ORANGE, META_TEAL]
-            max_score = max(scores)
-            
-            for j, (score, model, color) in enumerate(zip(scores, models, colors)):
-                bar_width = (score / max_score) * 4
-                bar = Rectangle(
-                    width=bar_width, 
-                    height=0.35,  # Reduced height to prevent overlap
-                    color=color, 
-                    fill_opacity=0.7
-                )
-                # Increased vertical spacing between bars
-                bar.move_to(LEFT * 3 + RIGHT * bar_width/2 + chart_y + DOWN * j * 0.8)
-                
-                score_label = Text(f"{score:.1f}", font_size=14, color=color, weight=BOLD)
-                score_label.next_to(bar, RIGHT, buff=0.2)
-                
-                model_label = Text(model, font_size=12, color=DARK_GRAY)
-                model_label.next_to(bar, LEFT, buff=0.2)
-                
-                bars.add(bar)
-                labels.add(VGroup(score_label, model_label))
-            
-            chart_group = VGroup(bench_title, bars, labels)
-            all_chart_elements.add(chart_group)
-            
-            self.play(FadeIn(bench_title))
-            self.play(LaggedStartMap(Create, bars, lag_ratio=0.2))
-            self.play(LaggedStartMap(FadeIn, labels, lag_ratio=0.2))
-            self.wait(0.5)
+        self.play(LaggedStartMap(FadeIn, chart.group_labels, lag_ratio=0.3))
+        self.play(LaggedStartMap(Create, chart.bars, lag_ratio=0.2), run_time=2)
+        self.play(
+            LaggedStartMap(FadeIn, chart.series_labels, lag_ratio=0.05),
+            LaggedStartMap(FadeIn, chart.value_labels, lag_ratio=0.05)
+        )
+        self.wait(1.5)
         
         # Impact statement positioned below all charts
         impact_statement = Text(
@@ -585,7 +568,7 @@ class LlamaThreeAnimation(Scene):
         self.wait(3)
         
         # Scene cleanup
-        results_elements = VGroup(results_title, all_chart_elements, impact_statement)
+        results_elements = VGroup(results_title, chart, impact_statement)
         self.play(FadeOut(results_elements))
         self.wait(0.5)
     
@@ -614,7 +597,7 @@ class LlamaThreeAnimation(Scene):
         
         innovation_items = VGroup()
         for innovation in innovations:
-            bullet = Text("•", font_size=24, color=META_BLUE, weight=BOLD)
+            bullet = cached_text("•", font_size=24, weight=BOLD, color=META_BLUE)
             text = Text(innovation, font_size=18, color=DARK_GRAY)
             
             item = VGroup(bullet, text)
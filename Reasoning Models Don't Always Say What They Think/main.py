@@ -1,6 +1,12 @@
 from manim import *
 import numpy as np
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from components.faithfulness import load_stats
+
 # Configuration for professional presentation
 config.pixel_height = 1080
 config.pixel_width = 1920
@@ -16,6 +22,10 @@ BACKGROUND_DARK = "#2C3E50"
 TEXT_WHITE = "#FFFFFF"
 TRANSPARENT_GRAY = "#95A5A6"
 
+# Evaluation dumps (JSONL, relative to this script) behind the figures in scenes 2-4;
+# without any, the paper's figures are shown
+EVAL_DUMPS = "data/*.jsonl"
+
 class FaithfulnessAnimation(Scene):
     def construct(self):
         """
@@ -88,7 +98,9 @@ class FaithfulnessAnimation(Scene):
         self.wait(1.5)
         
         # FIXED: Statistics positioned well below boxes to avoid overlap
-        stats_text = Text("Research Findings: Claude 3.7 Sonnet — 25% Faithful, DeepSeek R1 — 39% Faithful", 
+        findings = ", ".join(f"{model} — {faithfulness:.0%} Faithful"
+                             for model, faithfulness in self.eval_stats().model_faithfulness.items())
+        stats_text = Text(f"Research Findings: {findings}", 
                          font_size=20, color=WARNING_ORANGE, weight=BOLD)
         stats_text.move_to(DOWN * 2.8)  # Positioned at bottom
         
@@ -161,7 +173,8 @@ class FaithfulnessAnimation(Scene):
                                font_size=20, color=DECEPTION_RED, weight=BOLD)
         critical_finding.move_to(DOWN * 1.5)
         
-        faithfulness_stats = Text("Faithfulness across hint types: 12% - 28%", 
+        lowest, highest = self.eval_stats().hint_faithfulness_range
+        faithfulness_stats = Text(f"Faithfulness across hint types: {lowest:.0%} - {highest:.0%}", 
                                  font_size=18, color=WARNING_ORANGE)
         faithfulness_stats.move_to(DOWN * 2.2)
         
@@ -199,13 +212,14 @@ class FaithfulnessAnimation(Scene):
         stats_title.move_to(UP * 1.5)  # Moved higher
         
         # FIXED: Hack usage and verbalization moved up with proper spacing
+        stats = self.eval_stats()
         hack_title = Text("Hack Usage Rate", font_size=20, color=TEXT_WHITE, weight=BOLD)
         hack_title.move_to(LEFT * 3.5 + UP * 0.3)  # Moved up
         
         hack_box = Rectangle(width=2.5, height=0.8, color=DECEPTION_RED, fill_opacity=0.7, stroke_width=2)
         hack_box.move_to(LEFT * 3.5 + DOWN * 0.3)  # Moved up
         
-        hack_text = Text("99%", font_size=32, color=TEXT_WHITE, weight=BOLD)
+        hack_text = Text(f"{stats.hack_usage:.0%}", font_size=32, color=TEXT_WHITE, weight=BOLD)
         hack_text.move_to(hack_box.get_center())
         
         verbal_title = Text("Verbalization Rate", font_size=20, color=TEXT_WHITE, weight=BOLD)
@@ -214,7 +228,7 @@ class FaithfulnessAnimation(Scene):
         verbal_box = Rectangle(width=2.5, height=0.8, color=FAITHFUL_GREEN, fill_opacity=0.7, stroke_width=2)
         verbal_box.move_to(RIGHT * 3.5 + DOWN * 0.3)  # Moved up
         
-        verbal_text = Text("2%", font_size=32, color=TEXT_WHITE, weight=BOLD)
+        verbal_text = Text(f"{stats.hack_verbalization:.0%}", font_size=32, color=TEXT_WHITE, weight=BOLD)
         verbal_text.move_to(verbal_box.get_center())
         
         self.play(Transform(description, stats_title))
@@ -256,6 +270,8 @@ class FaithfulnessAnimation(Scene):
         self.play(Write(paradox_subtitle))
         self.wait(1)
         
+        stats = self.eval_stats()
+        
         # FIXED: Content positioned with proper spacing to avoid overlap
         # MMLU (Easy) section
         mmlu_title = Text("MMLU (Easy Tasks)", font_size=22, color=FAITHFUL_GREEN, weight=BOLD)
@@ -266,7 +282,7 @@ class FaithfulnessAnimation(Scene):
         
         mmlu_content = VGroup(
             Text("High school level", font_size=16, color=TEXT_WHITE),
-            Text("Faithfulness: 35%", font_size=18, color=FAITHFUL_GREEN, weight=BOLD)
+            Text(f"Faithfulness: {stats.dataset_faithfulness['mmlu']:.0%}", font_size=18, color=FAITHFUL_GREEN, weight=BOLD)
         )
         mmlu_content.arrange(DOWN, buff=0.2)
         mmlu_content.move_to(mmlu_box.get_center())
@@ -280,7 +296,7 @@ class FaithfulnessAnimation(Scene):
         
         gpqa_content = VGroup(
             Text("Graduate level", font_size=16, color=TEXT_WHITE),
-            Text("Faithfulness: 20%", font_size=18, color=DECEPTION_RED, weight=BOLD)
+            Text(f"Faithfulness: {stats.dataset_faithfulness['gpqa']:.0%}", font_size=18, color=DECEPTION_RED, weight=BOLD)
         )
         gpqa_content.arrange(DOWN, buff=0.2)
         gpqa_content.move_to(gpqa_box.get_center())
@@ -295,14 +311,15 @@ class FaithfulnessAnimation(Scene):
         # Decline arrow
         decline_arrow = Arrow(LEFT * 1.5 + UP * 0.5, RIGHT * 1.5 + UP * 0.5,
                              color=WARNING_ORANGE, stroke_width=6)
-        decline_text = Text("44% Drop!", font_size=20, color=WARNING_ORANGE, weight=BOLD)
+        decline_text = Text(f"{stats.relative_drop():.0%} Drop!", font_size=20, color=WARNING_ORANGE, weight=BOLD)
         decline_text.next_to(decline_arrow, UP, buff=0.2)
         
         self.play(GrowArrow(decline_arrow), Write(decline_text))
         self.wait(1)
         
         # FIXED: Key insight positioned well below content
-        insight = Text("Paradox: Unfaithful reasoning is longer (~2,000 tokens vs 1,400)", 
+        insight = Text(f"Paradox: Unfaithful reasoning is longer "
+                      f"(~{round(stats.unfaithful_cot_tokens, -2):,.0f} tokens vs {round(stats.faithful_cot_tokens, -2):,.0f})", 
                       font_size=18, color=WARNING_ORANGE, weight=BOLD)
         insight.move_to(DOWN * 1.8)  # Positioned lower to avoid overlap
         
@@ -323,6 +340,10 @@ class FaithfulnessAnimation(Scene):
         self.play(FadeOut(scene4_elements))
         self.wait(0.5)
     
+    def eval_stats(self):
+        """Faithfulness figures from the local evaluation dumps (cached), or the paper's"""
+        return load_stats(sorted(Path(__file__).parent.glob(EVAL_DUMPS)))
+    
     def scene5_safety_paradigm(self):
         """Scene 5: FIXED - Proper alignment of blue box with title"""
         self.clear()
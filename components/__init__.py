@@ -0,0 +1,5 @@
+"""Reusable mobjects and helpers shared by the paper animations.
+
+The scripts live one directory below the repository root, so they put the
+root on ``sys.path`` before importing from here.
+"""
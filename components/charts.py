@@ -0,0 +1,161 @@
+"""Bar charts whose geometry is computed in one vectorised pass."""
+
+import numpy as np
+from manim import (
+    BOLD, DARK_GRAY, DEFAULT_STROKE_WIDTH, DOWN, LEFT, RIGHT, UP, WHITE, Animation, Text, VectorizedPoint,
+    VGroup, VMobject,
+)
+
+from components.text import cached_text
+
+# Parameters at which a cubic Bezier segment is a straight edge.
+_LINE = np.array([0, 1 / 3, 2 / 3, 1])[:, None]
+
+
+def line_paths(starts, ends):
+    """Bezier points of many straight segments ``starts[i] -> ends[i]`` as one array of sub-paths."""
+    starts, ends = np.asarray(starts, dtype=float), np.asarray(ends, dtype=float)
+    return (starts[:, None] + _LINE * (ends - starts)[:, None]).reshape(-1, 3)
+
+
+def rectangle_paths(left, bottom, width, height):
+    """Bezier points of many axis-aligned rectangles as one array of sub-paths.
+
+    Each rectangle starts at its upper right corner and runs counter-clockwise
+    like manim's ``Rectangle``; the result can be passed to ``set_points``.
+    """
+    left, bottom, width, height = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (left, bottom, width, height))
+    )
+    right, top = left + width, bottom + height
+    corners = np.zeros((left.size, 4, 3))
+    corners[:, [1, 2], 0] = left.reshape(-1, 1)
+    corners[:, [0, 3], 0] = right.reshape(-1, 1)
+    corners[:, [0, 1], 1] = top.reshape(-1, 1)
+    corners[:, [2, 3], 1] = bottom.reshape(-1, 1)
+    ends = np.roll(corners, -1, axis=1)
+    return line_paths(corners.reshape(-1, 3), ends.reshape(-1, 3))
+
+
+class GroupedBarChart(VGroup):
+    """Horizontal bars for ``values[group, series]``, one batched path per series.
+
+    All bar geometry is computed with array operations and each series is a
+    single ``VMobject`` whose sub-paths are its bars, so the number of
+    mobjects does not grow with the number of groups.  Value, series and
+    group labels are optional; value labels (``value_labels="end"`` or
+    ``"inside"``) are one ``Text`` per bar, rebuilt on every ``set_values``,
+    so they are off by default and best left off for leaderboards with
+    hundreds of bars.
+
+    Bars start at ``ORIGIN`` and the first group's first bar is centred on it
+    vertically; place the chart with ``shift``/``move_to``.  Bar lengths are
+    ``values / max_value * bar_length``, where ``max_value`` defaults to each
+    group's own maximum.  With ``vertical=True`` the bars grow upwards and the
+    groups run to the right (e.g. a histogram: one group per bin, one series);
+    positions along the group axis, like ``group_label_x``, then become
+    heights.
+    """
+
+    def __init__(self, values, group_names=(), series_names=(), colors=(WHITE,), *,
+                 bar_length=4, max_value=None, bar_height=0.35, series_spacing=0.8, group_spacing=2.2,
+                 fill_opacity=0.7, stroke_width=DEFAULT_STROKE_WIDTH,
+                 group_label_x=-3, group_font_size=20, group_color=WHITE,
+                 value_labels=None, value_format="{:.1f}", value_font_size=14, value_color=None,
+                 series_labels=False, series_font_size=12, series_color=DARK_GRAY, label_buff=0.2,
+                 vertical=False, **kwargs):
+        super().__init__(**kwargs)
+        self.values = np.atleast_2d(np.asarray(values, dtype=float))
+        groups, series = self.values.shape
+        self.colors = [colors[s % len(colors)] for s in range(series)]
+        self.bar_length, self.max_value, self.bar_height = bar_length, max_value, bar_height
+        self.series_spacing, self.group_spacing = series_spacing, group_spacing
+        self.value_labels_at, self.value_format, self.label_buff = value_labels, value_format, label_buff
+        self.value_font_size, self.value_color = value_font_size, value_color
+        self.vertical = vertical
+
+        # Tracks where ORIGIN of the layout has been moved to.
+        self.anchor = VectorizedPoint()
+        self.bars = VGroup(*(
+            VMobject().set_fill(color, opacity=fill_opacity).set_stroke(color, width=stroke_width)
+            for color in self.colors
+        ))
+        self.group_labels = VGroup(*(
+            Text(name, font_size=group_font_size, color=group_color, weight=BOLD)
+            .move_to(self._point(group_label_x, y))
+            for name, y in zip(group_names, self._row_centers()[:, 0])
+        ))
+        self.series_labels = VGroup()
+        if series_labels:
+            rows = self._row_centers()
+            for g in range(groups):
+                for s, name in enumerate(series_names):
+                    label = cached_text(name, font_size=series_font_size, color=series_color)
+                    self.series_labels.add(label.move_to(self._point(-label_buff, rows[g, s]),
+                                                         aligned_edge=UP if vertical else RIGHT))
+        self.value_labels = VGroup()
+        self.add(self.anchor, self.bars, self.group_labels, self.series_labels, self.value_labels)
+        self.set_values(self.values)
+
+    def _row_centers(self):
+        groups, series = self.values.shape
+        return -(np.arange(groups)[:, None] * self.group_spacing
+                 + np.arange(series)[None, :] * self.series_spacing)
+
+    def _point(self, length, row):
+        """Scene offset (from the anchor) of ``length`` along a bar in row ``row``."""
+        return np.array([-row, length, 0.0]) if self.vertical else np.array([length, row, 0.0])
+
+    def bar_lengths(self, values):
+        scale = self.max_value if self.max_value is not None else values.max(axis=1, keepdims=True)
+        # An all-zero group (or max_value=0) draws zero-length bars, not NaNs.
+        return values / np.where(scale > 0, scale, 1) * self.bar_length
+
+    def set_values(self, values):
+        """Re-lay the bars (and value labels) for new ``values`` of the same shape, in place."""
+        self.values = np.atleast_2d(np.asarray(values, dtype=float))
+        lengths = self.bar_lengths(self.values)
+        rows = self._row_centers()
+        origin = self.anchor.get_center()
+        for s, bar in enumerate(self.bars):
+            if self.vertical:
+                paths = rectangle_paths(-rows[:, s] - self.bar_height / 2, 0, self.bar_height, lengths[:, s])
+            else:
+                paths = rectangle_paths(0, rows[:, s] - self.bar_height / 2, lengths[:, s], self.bar_height)
+            bar.set_points(paths + origin)
+
+        if self.value_labels_at is None:
+            return self
+        labels = []
+        for (g, s), value in np.ndenumerate(self.values):
+            label = Text(self.value_format.format(value), font_size=self.value_font_size,
+                         color=self.value_color or self.colors[s], weight=BOLD)
+            if self.value_labels_at == "inside":
+                label.move_to(origin + self._point(lengths[g, s] / 2, rows[g, s]))
+            else:
+                label.move_to(origin + self._point(lengths[g, s] + self.label_buff, rows[g, s]),
+                              aligned_edge=DOWN if self.vertical else LEFT)
+            labels.append(label)
+        if len(self.value_labels) == len(labels):
+            for old, new in zip(self.value_labels, labels):
+                old.become(new)
+        else:
+            self.value_labels.add(*labels)
+        return self
+
+
+class ChartTransition(Animation):
+    """Move the bars of a :class:`GroupedBarChart` from its current values to ``values``.
+
+    Every frame re-lays the bars from one interpolated array, in place; turn
+    value labels off (the default) for charts that change on every frame.
+    """
+
+    def __init__(self, chart, values, **kwargs):
+        self.start_values = chart.values
+        self.end_values = np.asarray(values, dtype=float).reshape(chart.values.shape)
+        super().__init__(chart, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        self.mobject.set_values(self.start_values + t * (self.end_values - self.start_values))
@@ -0,0 +1,68 @@
+"""Content hashes of (large) input files and JSON results cached by them.
+
+Scenes that are driven by local data (training logs, evaluation dumps) key
+their derived results on the content of the inputs, so moving or touching a
+file does not invalidate anything but editing it does.  Hashing a
+multi-gigabyte file is itself a full read, so :func:`file_digest` memoises
+digests by path, size and modification time in ``.cache/data/digests.json``.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent / ".cache" / "data"
+
+
+def _write_json(path, value):
+    """Write ``value`` atomically; render workers may be writing the same file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    partial.write_text(json.dumps(value, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(partial, path)
+
+
+def _read_json(path):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def file_digest(path, cache_dir=DATA_DIR):
+    """SHA-256 of ``path``'s content, re-read only when its size or mtime changed."""
+    path = Path(path).resolve()
+    stat = path.stat()
+    index_path = cache_dir / "digests.json"
+    index = _read_json(index_path) or {}
+    entry = index.get(str(path))
+    if entry and entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+        return entry[2]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    # Re-read the index: another worker may have added entries meanwhile.
+    index = _read_json(index_path) or {}
+    index[str(path)] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+    _write_json(index_path, index)
+    return digest.hexdigest()
+
+
+def cached_json(name, paths, build, version=1, cache_dir=DATA_DIR):
+    """``build(paths)``, cached as JSON under the content hashes of ``paths``.
+
+    ``name`` namespaces the cache and ``version`` should be bumped whenever
+    ``build`` changes what it computes.
+    """
+    key = hashlib.sha256(json.dumps(
+        [name, version, sorted(file_digest(path, cache_dir) for path in paths)]
+    ).encode()).hexdigest()[:32]
+    path = cache_dir / name / f"{key}.json"
+    result = _read_json(path)
+    if result is None:
+        result = build(paths)
+        _write_json(path, result)
+    return result
@@ -0,0 +1,127 @@
+"""Chain-of-thought faithfulness statistics aggregated from JSONL evaluation dumps.
+
+Each line of a dump is one evaluated sample.  Hint experiments and reward
+hacking runs are told apart by ``experiment``::
+
+    {"experiment": "hint", "model": "Claude 3.7 Sonnet", "hint_type": "sycophancy",
+     "dataset": "mmlu", "uses_hint": true, "verbalizes_hint": false, "cot_tokens": 1830}
+    {"experiment": "reward_hack", "exploits_hack": true, "verbalizes_hack": false}
+
+A chain of thought is *faithful* when the model used the hint (its answer
+changed to the hinted one) and says so.  The dumps are read once, line by
+line, into a handful of counters, so memory does not grow with their size;
+records missing a field are left out of the figures that need it.  The
+aggregates are cached by the dumps' content hashes (see
+:mod:`components.data`).  Figures a dump has no samples for fall back to the
+ones reported in the paper.
+"""
+
+import json
+from collections import defaultdict
+from dataclasses import dataclass
+
+from components.data import cached_json
+
+# Bump when the aggregation changes, to invalidate cached aggregates.
+AGGREGATE_VERSION = 2
+
+
+@dataclass(frozen=True)
+class FaithfulnessStats:
+    """The figures the Faithfulness scenes show, as fractions and token counts."""
+    model_faithfulness: dict        # model name -> faithfulness over all hints
+    hint_faithfulness_range: tuple  # (lowest, highest) over hint types
+    hack_usage: float
+    hack_verbalization: float
+    dataset_faithfulness: dict      # lower-cased dataset name -> faithfulness
+    unfaithful_cot_tokens: float
+    faithful_cot_tokens: float
+    samples: int = 0                # records aggregated; 0 for the paper's figures
+
+    def relative_drop(self, easy="mmlu", hard="gpqa"):
+        if not self.dataset_faithfulness[easy]:
+            return PAPER_STATS.relative_drop(easy, hard)
+        return 1 - self.dataset_faithfulness[hard] / self.dataset_faithfulness[easy]
+
+
+PAPER_STATS = FaithfulnessStats(
+    model_faithfulness={"Claude 3.7 Sonnet": 0.25, "DeepSeek R1": 0.39},
+    hint_faithfulness_range=(0.12, 0.28),
+    hack_usage=0.99,
+    hack_verbalization=0.02,
+    dataset_faithfulness={"mmlu": 0.35, "gpqa": 0.196},  # shown rounded; a 44% relative drop
+    unfaithful_cot_tokens=2000,
+    faithful_cot_tokens=1400,
+)
+
+
+def _ratio(hits, total):
+    return hits / total if total else None
+
+
+def aggregate(paths):
+    """Single streaming pass over the dumps; returns JSON-serialisable aggregates."""
+    # [samples that used the hint, of which verbalised it], per hint type / dataset
+    by_model = defaultdict(lambda: [0, 0])
+    by_hint_type = defaultdict(lambda: [0, 0])
+    by_dataset = defaultdict(lambda: [0, 0])
+    cot_tokens = {True: [0, 0], False: [0, 0]}  # faithful -> [token sum, samples]
+    hacks = [0, 0, 0]  # samples, exploited, exploited and verbalised
+    samples = 0
+
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                samples += 1
+                experiment = record.get("experiment")
+                if experiment == "hint" and record.get("uses_hint"):
+                    faithful = bool(record.get("verbalizes_hint"))
+                    for counts, key in ((by_model, record.get("model")),
+                                        (by_hint_type, record.get("hint_type")),
+                                        (by_dataset, str(record.get("dataset") or "").lower())):
+                        if key:
+                            counts[key][0] += 1
+                            counts[key][1] += faithful
+                    if "cot_tokens" in record:
+                        cot_tokens[faithful][0] += record["cot_tokens"]
+                        cot_tokens[faithful][1] += 1
+                elif experiment == "reward_hack":
+                    exploited = bool(record.get("exploits_hack"))
+                    hacks[0] += 1
+                    hacks[1] += exploited
+                    hacks[2] += exploited and bool(record.get("verbalizes_hack"))
+
+    hint_faithfulness = [_ratio(verbalised, used) for used, verbalised in by_hint_type.values()]
+    return {
+        "model_faithfulness": {model: _ratio(verbalised, used) for model, (used, verbalised) in by_model.items()},
+        "hint_faithfulness_range": [min(hint_faithfulness), max(hint_faithfulness)] if hint_faithfulness else None,
+        "hack_usage": _ratio(hacks[1], hacks[0]),
+        "hack_verbalization": _ratio(hacks[2], hacks[1]),
+        "dataset_faithfulness": {
+            dataset: _ratio(verbalised, used) for dataset, (used, verbalised) in by_dataset.items()
+        },
+        "unfaithful_cot_tokens": _ratio(*cot_tokens[False]),
+        "faithful_cot_tokens": _ratio(*cot_tokens[True]),
+        "samples": samples,
+    }
+
+
+def load_stats(paths):
+    """:class:`FaithfulnessStats` of the dumps at ``paths``, from the cache when unchanged."""
+    if not paths:
+        return PAPER_STATS
+    found = cached_json("faithfulness", paths, aggregate, version=AGGREGATE_VERSION)
+    return FaithfulnessStats(
+        model_faithfulness=found["model_faithfulness"] or PAPER_STATS.model_faithfulness,
+        hint_faithfulness_range=tuple(found["hint_faithfulness_range"] or PAPER_STATS.hint_faithfulness_range),
+        hack_usage=PAPER_STATS.hack_usage if found["hack_usage"] is None else found["hack_usage"],
+        hack_verbalization=(PAPER_STATS.hack_verbalization if found["hack_verbalization"] is None
+                            else found["hack_verbalization"]),
+        dataset_faithfulness={**PAPER_STATS.dataset_faithfulness, **found["dataset_faithfulness"]},
+        unfaithful_cot_tokens=found["unfaithful_cot_tokens"] or PAPER_STATS.unfaithful_cot_tokens,
+        faithful_cot_tokens=found["faithful_cot_tokens"] or PAPER_STATS.faithful_cot_tokens,
+        samples=found["samples"],
+    )
@@ -0,0 +1,65 @@
+"""A toy GRPO run, simulated with array operations over every sampled response."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class GRPOHistory:
+    """Per-step histograms of a :func:`simulate_grpo` run, as fractions of all responses."""
+    reward_edges: np.ndarray
+    advantage_edges: np.ndarray
+    reward_counts: np.ndarray     # (steps, reward bins)
+    advantage_counts: np.ndarray  # (steps, advantage bins)
+    mean_reward: np.ndarray       # (steps,)
+
+
+def simulate_grpo(num_prompts=256, group_size=512, steps=60, learning_rate=0.1, format_bonus=0.5,
+                  advantage_range=3.0, advantage_bins=24, seed=0):
+    """Simulate GRPO's group-relative advantages on a policy of per-prompt skills.
+
+    Each prompt has a probability of being answered correctly and one of the
+    answer following the required format (R1-Zero's two rule-based rewards).
+    Every step samples ``group_size`` responses per prompt, scores them with
+    ``correct + format_bonus * formatted``, normalises within each group,
+    ``A_i = (r_i - mean(r)) / std(r)``, and moves the policy logits along the
+    advantage-weighted score-function gradient.  Groups whose responses all
+    score the same get zero advantage and do not learn, as in GRPO.
+
+    All prompts and responses are handled as ``(num_prompts, group_size)``
+    arrays and only the histograms are kept, so thousands of responses per
+    prompt cost a few milliseconds per step.
+    """
+    rng = np.random.default_rng(seed)
+    # Most prompts start out hard; the format is easier to pick up.
+    correct_logits = rng.normal(-2.0, 1.0, num_prompts)
+    format_logits = rng.normal(-0.5, 1.0, num_prompts)
+
+    levels = np.unique([0.0, format_bonus, 1.0, 1.0 + format_bonus])
+    middles = (levels[1:] + levels[:-1]) / 2
+    reward_edges = np.concatenate([[levels[0] - 0.25], middles, [levels[-1] + 0.25]])
+    advantage_edges = np.linspace(-advantage_range, advantage_range, advantage_bins + 1)
+    reward_counts = np.empty((steps, len(levels)))
+    advantage_counts = np.empty((steps, advantage_bins))
+    mean_reward = np.empty(steps)
+    total = num_prompts * group_size
+
+    for step in range(steps):
+        p_correct = 1 / (1 + np.exp(-correct_logits[:, None]))
+        p_format = 1 / (1 + np.exp(-format_logits[:, None]))
+        correct = rng.random((num_prompts, group_size), dtype=np.float32) < p_correct
+        formatted = rng.random((num_prompts, group_size), dtype=np.float32) < p_format
+        rewards = correct + format_bonus * formatted
+        advantages = ((rewards - rewards.mean(axis=1, keepdims=True))
+                      / (rewards.std(axis=1, keepdims=True) + 1e-4))
+
+        reward_counts[step] = np.histogram(rewards, reward_edges)[0] / total
+        clipped = np.clip(advantages, -advantage_range, advantage_range)
+        advantage_counts[step] = np.histogram(clipped, advantage_edges)[0] / total
+        mean_reward[step] = rewards.mean()
+
+        correct_logits += learning_rate * (advantages * (correct - p_correct)).mean(axis=1)
+        format_logits += learning_rate * (advantages * (formatted - p_format)).mean(axis=1)
+
+    return GRPOHistory(reward_edges, advantage_edges, reward_counts, advantage_counts, mean_reward)
@@ -0,0 +1,93 @@
+"""Matrix heatmaps drawn as a single image instead of one square per cell."""
+
+import numpy as np
+from manim import (
+    BLACK, BLUE_E, DOWN, LEFT, PI, RESAMPLING_ALGORITHMS, RIGHT, UP, YELLOW, Animation, ImageMobject,
+    ManimColor, VGroup,
+)
+
+from components.text import cached_text
+
+
+def colormap(colors, size=256):
+    """``(size, 3)`` uint8 lookup table running through ``colors`` evenly."""
+    stops = np.array([ManimColor(color).to_rgb() for color in colors])
+    positions = np.linspace(0, 1, len(stops))
+    samples = np.linspace(0, 1, size)
+    table = np.stack([np.interp(samples, positions, stops[:, channel]) for channel in range(3)], axis=1)
+    return np.round(table * 255).astype(np.uint8)
+
+
+class Heatmap(ImageMobject):
+    """A matrix shown as an image: one pixel per cell, coloured through a lookup table.
+
+    The camera draws it with nearest-neighbour scaling, so cells stay crisp at
+    any size, and the cost of a frame does not depend on the number of cells.
+    :meth:`set_matrix` swaps the data in place (a different shape shows a
+    different part of the matrix in the same box, e.g. to zoom in) and
+    :class:`MatrixTransition` blends between two matrices.
+    """
+
+    def __init__(self, values, height=4, colors=(BLACK, BLUE_E, YELLOW), vmin=0.0, vmax=1.0, **kwargs):
+        self.lut = colormap(colors)
+        self.vmin, self.vmax = vmin, vmax
+        self.values = np.asarray(values, dtype=np.float32)
+        super().__init__(self.to_pixels(self.values), **kwargs)
+        self.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        self.height = height
+
+    def to_pixels(self, values):
+        scaled = np.clip((values - self.vmin) / (self.vmax - self.vmin), 0, 1)
+        rgb = self.lut[(scaled * (len(self.lut) - 1)).astype(np.intp)]
+        return np.dstack([rgb, np.full(values.shape, 255, dtype=np.uint8)])
+
+    def set_matrix(self, values):
+        values = np.asarray(values, dtype=np.float32)
+        pixels = self.to_pixels(values)
+        if values.shape == self.values.shape:
+            # Keep the current opacity (e.g. during a fade).
+            pixels[:, :, 3] = self.pixel_array[:, :, 3]
+        else:
+            self.orig_alpha_pixel_array = pixels[:, :, 3].copy()
+        self.values = values
+        self.pixel_array = pixels
+        return self
+
+    @property
+    def cell_size(self):
+        """On-screen height of one row, in scene units."""
+        return self.height / self.values.shape[0]
+
+    def token_labels(self, tokens, font_size=16, min_cell_size=0.2, buff=0.15, color=None):
+        """Row labels on the left and column labels on top, if the cells are readable.
+
+        Returns an empty group while a row is shorter than ``min_cell_size``,
+        so the same code can run at every zoom level.
+        """
+        labels = VGroup()
+        rows, columns = self.values.shape
+        if self.cell_size < min_cell_size:
+            return labels
+        top_left = self.get_corner(UP + LEFT)
+        for i, token in enumerate(tokens[:rows]):
+            label = cached_text(token, font_size=font_size, color=color)
+            labels.add(label.move_to(top_left + LEFT * buff + DOWN * (i + 0.5) * self.cell_size,
+                                     aligned_edge=RIGHT))
+        for j, token in enumerate(tokens[:columns]):
+            label = cached_text(token, font_size=font_size, color=color).rotate(PI / 2)
+            labels.add(label.move_to(top_left + UP * buff + RIGHT * (j + 0.5) * self.width / columns,
+                                     aligned_edge=DOWN))
+        return labels
+
+
+class MatrixTransition(Animation):
+    """Blend a :class:`Heatmap` from its current matrix to ``values`` (same shape)."""
+
+    def __init__(self, heatmap, values, **kwargs):
+        self.start_values = heatmap.values
+        self.end_values = np.asarray(values, dtype=np.float32)
+        super().__init__(heatmap, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        self.mobject.set_matrix(self.start_values + t * (self.end_values - self.start_values))
@@ -0,0 +1,124 @@
+"""Training-loss curves read from long logs and drawn at screen resolution."""
+
+import array
+import csv
+import math
+from pathlib import Path
+
+import numpy as np
+from manim import Animation, VMobject, config, linear
+
+
+def read_log(path, column="loss", step_column="step"):
+    """``(steps, losses)`` of a training log, without holding it as Python objects.
+
+    ``.npy`` logs are memory-mapped: a 1-D array is the loss at every step, a
+    2-D array has the steps in its first column and the loss in its last.
+    CSV logs are streamed row by row into compact float buffers; rows without
+    a finite, numeric ``column`` value or step (eval-only rows, blank cells,
+    a repeated header) are skipped and, without a ``step_column``, the row
+    number is used as the step.
+    """
+    path = Path(path)
+    if path.suffix == ".npy":
+        data = np.load(path, mmap_mode="r")
+        if data.ndim == 1:
+            return np.arange(len(data)), data
+        return data[:, 0], data[:, -1]
+
+    steps, losses = array.array("d"), array.array("d")
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        loss_index = header.index(column)
+        step_index = header.index(step_column) if step_column in header else None
+        for row_number, row in enumerate(reader):
+            try:
+                loss = float(row[loss_index])
+                step = float(row[step_index]) if step_index is not None else row_number
+            except (IndexError, ValueError):
+                continue
+            if math.isfinite(loss):
+                losses.append(loss)
+                steps.append(step)
+    return np.frombuffer(steps), np.frombuffer(losses)
+
+
+def lttb(x, y, threshold):
+    """Indices of the ``threshold`` points Largest-Triangle-Three-Buckets keeps.
+
+    The first and last points are always kept; in between, each bucket keeps
+    the point forming the largest triangle with the previously kept point and
+    the next bucket's average, which preserves spikes a plain stride would
+    drop.  Buckets are visited in order, so a memory-mapped log is read in
+    sequential passes.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    buckets = threshold - 2
+    edges = np.linspace(1, n - 1, buckets + 1).astype(np.intp)
+    counts = np.diff(edges)
+    inner = slice(1, n - 1)
+    average_x = np.add.reduceat(np.asarray(x[inner], dtype=float), edges[:-1] - 1) / counts
+    average_y = np.add.reduceat(np.asarray(y[inner], dtype=float), edges[:-1] - 1) / counts
+    next_x = np.append(average_x[1:], x[n - 1])
+    next_y = np.append(average_y[1:], y[n - 1])
+
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(buckets):
+        start, stop = edges[i], edges[i + 1]
+        bucket_x = np.asarray(x[start:stop], dtype=float)
+        bucket_y = np.asarray(y[start:stop], dtype=float)
+        previous_x, previous_y = float(x[previous]), float(y[previous])
+        area = np.abs((previous_x - next_x[i]) * (bucket_y - previous_y)
+                      - (previous_x - bucket_x) * (next_y[i] - previous_y))
+        previous = start + int(area.argmax())
+        selected[i + 1] = previous
+    return selected
+
+
+def pixel_width(width):
+    """How many output pixels ``width`` scene units cover at the current resolution."""
+    return max(3, round(width / config.frame_width * config.pixel_width))
+
+
+class LossCurve(VMobject):
+    """A loss log plotted on ``axes`` with one vertex per horizontal pixel.
+
+    The log is downsampled with :func:`lttb` to the pixel width of the axes
+    (or to ``samples`` points), so a curve of millions of steps costs the
+    same to draw as one of a thousand.  :meth:`reveal` shows a prefix of the
+    path as a view of the full point array; place the curve before revealing
+    it, since moving it afterwards only moves the visible part.
+    """
+
+    def __init__(self, axes, steps, losses, samples=None, **kwargs):
+        super().__init__(**kwargs)
+        keep = lttb(steps, losses, samples or pixel_width(axes.x_axis.width))
+        self.steps = np.asarray(steps[keep], dtype=float)
+        self.losses = np.asarray(losses[keep], dtype=float)
+        self.set_points_as_corners(axes.coords_to_point(self.steps, self.losses).T)
+        self.full_points = self.points
+
+    def reveal(self, fraction):
+        """Show the curve up to ``fraction`` of its samples (whole segments, each about a pixel).
+
+        At least the first segment stays visible, so ``get_end`` always works.
+        """
+        segments = len(self.full_points) // self.n_points_per_curve
+        shown = max(1, round(np.clip(fraction, 0, 1) * segments))
+        self.points = self.full_points[:shown * self.n_points_per_curve]
+        return self
+
+
+class RevealCurve(Animation):
+    """Draw a :class:`LossCurve` from left to right, at a constant rate by default."""
+
+    def __init__(self, curve, rate_func=linear, introducer=True, **kwargs):
+        super().__init__(curve, rate_func=rate_func, introducer=introducer, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.reveal(self.rate_func(alpha))
@@ -0,0 +1,101 @@
+"""Diagrams of full-size transformer stacks with level-of-detail collapsing."""
+
+import math
+
+import numpy as np
+from manim import BLUE, BLUE_E, GRAY, RIGHT, UP, VectorizedPoint, VGroup, VMobject, config
+
+from components.charts import line_paths, rectangle_paths
+from components.point_cloud import PointCloud
+from components.text import cached_text
+
+
+class LayeredNetwork(VGroup):
+    """``layers`` stacked rows of ``heads`` blocks of ``units / heads`` units, fully connected.
+
+    The stack is centred on ``ORIGIN``, first layer at the bottom.  Geometry
+    is computed with array operations and drawn with one mobject per kind of
+    element: ``nodes`` is a :class:`PointCloud` of every unit, or a single
+    path of one block per head once units would be closer than
+    ``min_unit_pixels`` on screen, and ``edges`` is a single path holding
+    every connection between consecutive layers.  Connectivity is drawn at
+    the finest level that fits in ``max_edges``: unit to unit, else head to
+    head, else one translucent band per pair of layers.  ``node_level`` and
+    ``edge_level`` report the choice (``"units"``, ``"heads"`` or
+    ``"layers"``).
+    """
+
+    def __init__(self, layers=12, heads=12, units=768, width=5, height=4, *,
+                 max_edges=4000, min_unit_pixels=3, head_gap=0.2,
+                 node_color=BLUE, head_color=BLUE_E, edge_color=GRAY, edge_opacity=0.25,
+                 edge_width=0.5, band_opacity=0.15, **kwargs):
+        super().__init__(**kwargs)
+        self.num_layers, self.num_heads, self.num_units = layers, heads, units
+        self.layer_spacing = height / max(layers - 1, 1)
+        self.thickness = min(0.12, 0.35 * self.layer_spacing)
+        self.layer_y = -height / 2 + np.arange(layers) * self.layer_spacing
+        head_width = width / (heads + (heads - 1) * head_gap)
+        head_left = -width / 2 + np.arange(heads) * head_width * (1 + head_gap)
+        self.head_x = head_left + head_width / 2
+        per_head = units // heads
+        self.unit_x = (head_left[:, None] + (np.arange(per_head) + 0.5) / per_head * head_width).ravel()
+
+        # Tracks where ORIGIN of the layout has been moved to.
+        self.anchor = VectorizedPoint()
+        if head_width / per_head / config.frame_width * config.pixel_width >= min_unit_pixels:
+            self.node_level = "units"
+            xs, ys = np.meshgrid(self.unit_x, self.layer_y)
+            self.nodes = PointCloud(np.stack([xs.ravel(), ys.ravel()], axis=1), node_color)
+        else:
+            self.node_level = "heads"
+            self.nodes = VMobject().set_fill(head_color, opacity=0.8).set_stroke(width=0)
+            left = np.repeat(head_left[None, :], layers, axis=0)
+            bottom = np.repeat(self.layer_y[:, None] - self.thickness / 2, heads, axis=1)
+            self.nodes.set_points(rectangle_paths(left, bottom, head_width, self.thickness))
+
+        pairs = layers - 1
+        self.edges = VMobject()
+        if self.node_level == "units" and pairs * len(self.unit_x) ** 2 <= max_edges:
+            self.edge_level = "units"
+            self._connect(self.unit_x, edge_color, edge_opacity, edge_width)
+        elif pairs * heads ** 2 <= max_edges:
+            self.edge_level = "heads"
+            self._connect(self.head_x, edge_color, edge_opacity, edge_width)
+        else:
+            self.edge_level = "layers"
+            self.edges.set_fill(edge_color, opacity=band_opacity).set_stroke(width=0)
+            if pairs:
+                self.edges.set_points(rectangle_paths(
+                    -width / 2, self.layer_y[:-1] + self.thickness / 2,
+                    width, self.layer_spacing - self.thickness,
+                ))
+        self.add(self.anchor, self.edges, self.nodes)
+
+    def _connect(self, xs, color, opacity, width):
+        """Every ``xs`` position of each layer to every one of the next, bottom layer first."""
+        lower = np.repeat(xs, len(xs))
+        upper = np.tile(xs, len(xs))
+        starts = np.zeros((len(self.layer_y) - 1, len(lower), 3))
+        ends = np.zeros_like(starts)
+        starts[:, :, 0], ends[:, :, 0] = lower, upper
+        starts[:, :, 1] = (self.layer_y[:-1] + self.thickness / 2)[:, None]
+        ends[:, :, 1] = (self.layer_y[1:] - self.thickness / 2)[:, None]
+        self.edges.set_points(line_paths(starts.reshape(-1, 3), ends.reshape(-1, 3)))
+        self.edges.set_stroke(color, width=width, opacity=opacity)
+
+    def layer_labels(self, font_size=14, min_spacing=0.4, buff=0.2, color=None):
+        """``Layer i`` labels on the left, thinned to every k-th layer (always the last one)."""
+        every = math.ceil(min_spacing / self.layer_spacing) if self.num_layers > 1 else 1
+        shown = list(range(0, self.num_layers, every))
+        if shown[-1] != self.num_layers - 1:
+            if self.layer_spacing * (self.num_layers - 1 - shown[-1]) < min_spacing:
+                shown.pop()
+            shown.append(self.num_layers - 1)
+        left = self.get_left()[0] - buff
+        labels = VGroup()
+        for i in shown:
+            label = cached_text(f"Layer {i + 1}", font_size=font_size, color=color)
+            position = self.anchor.get_center() + UP * self.layer_y[i]
+            position[0] = left
+            labels.add(label.move_to(position, aligned_edge=RIGHT))
+        return labels
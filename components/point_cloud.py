@@ -0,0 +1,71 @@
+"""Large point clouds (tens of thousands of points) as a single mobject."""
+
+import numpy as np
+from manim import WHITE, Animation, PMobject, color_to_rgba
+
+from components.heatmap import colormap
+
+
+class PointCloud(PMobject):
+    """Points and their colours in contiguous float32 arrays.
+
+    Being a ``PMobject``, the whole cloud is rasterised by the camera in one
+    vectorised call rather than as one ``Dot`` per point.  ``positions`` may
+    be 2-D (a projection) or 3-D; ``colors`` is one colour or an ``(n, 3|4)``
+    array of floats in [0, 1].
+    """
+
+    def __init__(self, positions, colors=WHITE, stroke_width=2, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        self.set_positions(positions)
+        self.set_colors(colors)
+
+    def set_positions(self, positions):
+        positions = np.asarray(positions, dtype=np.float32)
+        points = np.zeros((len(positions), 3), dtype=np.float32)
+        points[:, :positions.shape[1]] = positions
+        self.points = points
+        return self
+
+    def set_colors(self, colors):
+        rgbas = np.ones((len(self.points), 4), dtype=np.float32)
+        if np.ndim(colors) == 2:
+            colors = np.asarray(colors, dtype=np.float32)
+            rgbas[:, :colors.shape[1]] = colors
+        else:
+            rgbas[:] = color_to_rgba(colors)
+        self.rgbas = rgbas
+        return self
+
+
+def colors_by_value(values, colors, vmin=None, vmax=None):
+    """``(n, 3)`` float32 colours for ``values`` through a gradient of ``colors``."""
+    values = np.asarray(values, dtype=np.float32)
+    vmin = values.min() if vmin is None else vmin
+    vmax = values.max() if vmax is None else vmax
+    lut = colormap(colors).astype(np.float32) / 255
+    scaled = np.clip((values - vmin) / ((vmax - vmin) or 1), 0, 1)
+    return lut[(scaled * (len(lut) - 1)).astype(np.intp)]
+
+
+class CloudTransition(Animation):
+    """Move every point of a :class:`PointCloud` to ``positions`` (and ``colors``).
+
+    Start and end arrays are computed once; each frame is one fused
+    multiply-add into the cloud's own buffers, with no per-point Python work.
+    """
+
+    def __init__(self, cloud, positions, colors=None, **kwargs):
+        cloud.points = np.ascontiguousarray(cloud.points, dtype=np.float32)
+        cloud.rgbas = np.ascontiguousarray(cloud.rgbas, dtype=np.float32)
+        target = PointCloud(positions, colors if colors is not None else cloud.rgbas)
+        self.start_points, self.delta_points = cloud.points.copy(), target.points - cloud.points
+        self.start_rgbas, self.delta_rgbas = cloud.rgbas.copy(), target.rgbas - cloud.rgbas
+        super().__init__(cloud, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        t = np.float32(self.rate_func(alpha))
+        np.multiply(self.delta_points, t, out=self.mobject.points)
+        self.mobject.points += self.start_points
+        np.multiply(self.delta_rgbas, t, out=self.mobject.rgbas)
+        self.mobject.rgbas += self.start_rgbas
@@ -0,0 +1,100 @@
+"""Memoised ``Text`` construction.
+
+The scenes build many identical ``Text`` objects (bullets, ``[MASK]``,
+"Stage N" labels, repeated titles), and each one goes through Pango layout
+and SVG parsing.  :func:`cached_text` builds a given
+``(text, font_size, weight, slant, font, line_spacing)`` once, keeps the
+result in an in-process LRU and hands out copies.  Built glyph outlines are
+also written to a content-addressed store under ``.cache/text`` so later runs
+(and the other render workers) skip Pango entirely.
+"""
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+
+from manim import DEFAULT_FONT_SIZE, NORMAL, Text
+from manim import __version__ as MANIM_VERSION
+
+STORE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "text"
+LRU_SIZE = 512
+
+
+class TextCache:
+    """LRU of prototype ``Text`` mobjects backed by an on-disk store."""
+
+    def __init__(self, maxsize=LRU_SIZE, store_dir=STORE_DIR):
+        self.maxsize = maxsize
+        self.store_dir = Path(store_dir) if store_dir else None
+        self._prototypes = OrderedDict()
+        self.hits = self.disk_hits = self.misses = 0
+
+    def get(self, text, font_size, weight, slant, font, line_spacing):
+        key = (text, font_size, weight, slant, font, line_spacing)
+        prototype = self._prototypes.get(key)
+        if prototype is not None:
+            self._prototypes.move_to_end(key)
+            self.hits += 1
+        else:
+            prototype = self._load(key)
+            if prototype is None:
+                self.misses += 1
+                prototype = Text(text, font_size=font_size, weight=weight, slant=slant,
+                                 font=font, line_spacing=line_spacing)
+                self._save(key, prototype)
+            else:
+                self.disk_hits += 1
+            self._prototypes[key] = prototype
+            if len(self._prototypes) > self.maxsize:
+                self._prototypes.popitem(last=False)
+        return prototype.copy()
+
+    def _path(self, key):
+        digest = hashlib.sha256(repr((MANIM_VERSION, key)).encode("utf-8")).hexdigest()
+        return self.store_dir / digest[:2] / f"{digest}.pkl"
+
+    def _load(self, key):
+        if self.store_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Written by an incompatible manim build; rebuild and overwrite.
+            return None
+
+    def _save(self, key, prototype):
+        if self.store_dir is None:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with partial.open("wb") as f:
+                pickle.dump(prototype, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Not fatal: this entry simply stays in-process only.
+            partial.unlink(missing_ok=True)
+            return
+        os.replace(partial, path)
+
+
+TEXT_CACHE = TextCache()
+
+
+def cached_text(text, font_size=DEFAULT_FONT_SIZE, weight=NORMAL, slant=NORMAL,
+                font="", line_spacing=-1, color=None):
+    """Drop-in for ``Text(...)`` with the common styling arguments.
+
+    Colour is applied to the returned copy, so the same glyphs are shared
+    between differently coloured uses.
+    """
+    mobject = TEXT_CACHE.get(text, font_size, weight, slant, font, line_spacing)
+    if color is not None:
+        mobject.set_color(color)
+    return mobject
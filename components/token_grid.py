@@ -0,0 +1,82 @@
+"""Very long token sequences drawn as one raster, one pixel per token."""
+
+import numpy as np
+from manim import GRAY_A, RESAMPLING_ALGORITHMS, Animation, ImageMobject, ManimColor
+
+
+def _rgb(color):
+    return np.round(np.array(ManimColor(color).to_rgb()) * 255).astype(np.uint8)
+
+
+class TokenGrid(ImageMobject):
+    """``num_cells`` token cells laid out row by row, ``columns`` to a row, as an image.
+
+    Cell ``i`` is pixel ``i`` of the image, so a range of tokens is a slice
+    of the flattened pixel array: :meth:`fill` recolours cells,
+    :meth:`overlay` tints them on top of their colour (e.g. to show an
+    attention span) and :meth:`clear_overlay` removes the tint.  Drawing
+    costs the same for 8K or 128K cells.
+    """
+
+    def __init__(self, num_cells, columns=512, height=3, color=GRAY_A, **kwargs):
+        rows = -(-num_cells // columns)
+        self.num_cells, self.columns = num_cells, columns
+        self.base = np.zeros((rows * columns, 3), dtype=np.uint8)
+        self.base[:] = _rgb(color)
+        pixels = np.full((rows, columns, 4), 255, dtype=np.uint8)
+        pixels[:, :, :3] = self.base.reshape(rows, columns, 3)
+        # Padding after the last token in the last row stays transparent.
+        pixels.reshape(-1, 4)[num_cells:, 3] = 0
+        super().__init__(pixels, **kwargs)
+        self.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        self.height = height
+
+    @property
+    def cells(self):
+        """``(cells, 4)`` view of the pixel array (animations may replace the array)."""
+        return self.pixel_array.reshape(-1, 4)
+
+    def fill(self, start, stop, color):
+        self.base[start:stop] = _rgb(color)
+        self.cells[start:stop, :3] = self.base[start:stop]
+        return self
+
+    def overlay(self, start, stop, color, opacity=0.5):
+        tinted = self.base[start:stop] * (1 - opacity) + _rgb(color) * opacity
+        self.cells[start:stop, :3] = np.round(tinted).astype(np.uint8)
+        return self
+
+    def clear_overlay(self, start=0, stop=None):
+        self.cells[start:stop, :3] = self.base[start:stop]
+        return self
+
+
+class SweepCells(Animation):
+    """Fill cells ``start:stop`` of a :class:`TokenGrid` in order, as the window grows.
+
+    With ``opacity`` below 1 the cells are tinted with :meth:`TokenGrid.overlay`
+    instead.  Each frame writes two slices; cells the sweep has not reached
+    yet (or has left again, for rate functions that go back) keep their
+    colour from before the animation.
+    """
+
+    def __init__(self, grid, start, stop, color, opacity=1.0, **kwargs):
+        self.start, self.stop = start, stop
+        self.color, self.opacity = color, opacity
+        super().__init__(grid, **kwargs)
+
+    def begin(self):
+        self.base_before = self.mobject.base[self.start:self.stop].copy()
+        self.cells_before = self.mobject.cells[self.start:self.stop, :3].copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        grid = self.mobject
+        reached = self.start + round(self.rate_func(alpha) * (self.stop - self.start))
+        if self.opacity < 1:
+            grid.overlay(self.start, reached, self.color, self.opacity)
+        else:
+            grid.fill(self.start, reached, self.color)
+        offset = reached - self.start
+        grid.base[reached:self.stop] = self.base_before[offset:]
+        grid.cells[reached:self.stop, :3] = self.cells_before[offset:]
@@ -0,0 +1,6 @@
+"""Render tooling shared by all of the paper animations.
+
+Run the entry points from the repository root, e.g.::
+
+    python -m tools.render BERTBreakthrough -q h -j 8
+"""
@@ -0,0 +1,268 @@
+"""Render benchmarks with a local history, to catch manim/Cairo/Pango regressions.
+
+Each benchmark renders one scene -- a fixed, representative subset of its
+sections by default, or every section with ``--full`` -- at a fixed small
+resolution and frame rate in a fresh process, and records
+
+* frames per second (frames written / render wall time),
+* peak RSS of the rendering process,
+* time to first frame (process start to the first frame handed to the
+  encoder: imports, font setup, LaTeX and the first section's mobjects).
+
+Results go to a SQLite database together with the manim, Cairo and Pango
+versions.  Every result is compared with the median of the previous runs of
+the same benchmark (the rolling baseline) and flagged when it is worse by
+more than the threshold; the exit status is 1 if anything regressed::
+
+    python -m tools.benchmark
+    python -m tools.benchmark DeepSeekR1Animation --full --threshold 0.05
+    python -m tools.benchmark --history DeepSeekR1Animation
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import queue
+import resource
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from datetime import datetime, timezone
+from importlib import metadata
+
+from tools.render import configured_scene
+from tools.scenes import REPO_ROOT, discover_scenes, find_scene, section_scene
+
+HISTORY_DB = REPO_ROOT / ".benchmarks" / "history.sqlite"
+
+RESOLUTION = (640, 360)
+FRAME_RATE = 15
+
+# Sections that cover the expensive paths of each scene: MathTex, long Text
+# runs, many small mobjects and LaggedStart-heavy layouts.
+BENCHMARK_SECTIONS = {
+    "BERTBreakthrough": ["show_masked_language_model", "show_final_synthesis"],
+    "GPTPaperAnimation": ["training_process", "key_results"],
+    "LlamaThreeAnimation": ["dpo_vs_ppo_comparison", "results_and_impact"],
+    "DeepSeekR1Animation": ["grpo_algorithm", "performance_results"],
+    "FaithfulnessAnimation": ["scene2_hint_experiment", "scene4_capability_vs_transparency"],
+}
+
+# Direction in which each metric gets worse.
+METRICS = {"fps": "lower", "peak_rss_mb": "higher", "ttff": "higher"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started TEXT NOT NULL,
+    git_rev TEXT,
+    versions TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    benchmark TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    frames INTEGER NOT NULL,
+    wall REAL NOT NULL,
+    fps REAL NOT NULL,
+    peak_rss_mb REAL NOT NULL,
+    ttff REAL NOT NULL
+);
+"""
+
+
+def _version(distribution):
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def library_versions():
+    versions = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "manim": _version("manim"),
+        "pycairo": _version("pycairo"),
+        "manimpango": _version("manimpango"),
+    }
+    try:
+        import cairo
+        versions["cairo"] = cairo.cairo_version_string()
+    except ImportError:
+        pass
+    try:
+        import manimpango
+        versions["pango"] = manimpango.pango_version()
+    except (ImportError, AttributeError):
+        pass
+    return versions
+
+
+def _run_benchmark(scene_name, sections, started, results):
+    """Child-process body: report frames, timings and peak RSS, or the error."""
+    try:
+        results.put(_measure(scene_name, sections, started))
+    except BaseException:
+        results.put({"error": traceback.format_exc()})
+
+
+def _measure(scene_name, sections, started):
+    info = find_scene(scene_name)
+    frames, first_frame = 0, None
+    settings = info.render_config() + [
+        ("pixel_width", RESOLUTION[0]), ("pixel_height", RESOLUTION[1]), ("frame_rate", FRAME_RATE),
+    ]
+    with tempfile.TemporaryDirectory() as media_dir:
+        with configured_scene(info, settings, media_dir=media_dir, disable_caching=True) as scene_cls:
+            scene = section_scene(scene_cls, sections)()
+            renderer = scene.renderer
+            add_frame = renderer.add_frame
+
+            def counted_add_frame(frame, num_frames=1):
+                nonlocal frames, first_frame
+                if not renderer.skip_animations:
+                    if first_frame is None:
+                        first_frame = time.time()
+                    frames += num_frames
+                return add_frame(frame, num_frames)
+            renderer.add_frame = counted_add_frame
+
+            render_start = time.perf_counter()
+            scene.render()
+            wall = time.perf_counter() - render_start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "frames": frames,
+        "wall": wall,
+        "fps": frames / wall if wall else 0.0,
+        "peak_rss_mb": peak_kb / 1024,
+        "ttff": (first_frame or time.time()) - started,
+    }
+
+
+def run_benchmark(scene_name, sections):
+    """Run one benchmark in a freshly spawned interpreter."""
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_run_benchmark, args=(scene_name, sections, time.time(), results))
+    process.start()
+    result = None
+    # A child killed outright (e.g. by a signal) never puts anything on the queue.
+    while result is None and (process.is_alive() or not results.empty()):
+        try:
+            result = results.get(timeout=1)
+        except queue.Empty:
+            pass
+    process.join()
+    if result is None:
+        raise RuntimeError(f"benchmark {scene_name} failed with exit code {process.exitcode}")
+    if "error" in result:
+        raise RuntimeError(f"benchmark {scene_name} failed:\n{result['error']}")
+    return result
+
+
+def open_history(path=HISTORY_DB):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+
+def baseline(db, benchmark, resolution, window):
+    """Median of each metric over the last ``window`` recorded runs."""
+    rows = db.execute(
+        "SELECT fps, peak_rss_mb, ttff FROM results WHERE benchmark = ? AND resolution = ? "
+        "ORDER BY run_id DESC LIMIT ?",
+        (benchmark, resolution, window),
+    ).fetchall()
+    if not rows:
+        return None
+    return {metric: statistics.median(row[i] for row in rows) for i, metric in enumerate(METRICS)}
+
+
+def regressions(result, reference, threshold):
+    flagged = []
+    for metric, worse in METRICS.items():
+        base, value = reference[metric], result[metric]
+        if not base:
+            continue
+        change = (value - base) / base
+        if (worse == "lower" and change < -threshold) or (worse == "higher" and change > threshold):
+            flagged.append(f"{metric} {base:.2f} -> {value:.2f} ({change:+.0%})")
+    return flagged
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_history(db, benchmark):
+    rows = db.execute(
+        "SELECT runs.started, runs.git_rev, runs.versions, fps, peak_rss_mb, ttff "
+        "FROM results JOIN runs ON runs.id = results.run_id WHERE benchmark = ? ORDER BY run_id",
+        (benchmark,),
+    ).fetchall()
+    for started, rev, versions, fps, rss, ttff in rows:
+        v = json.loads(versions)
+        print(f"{started[:19]} {rev or '-':>9} manim={v.get('manim')} cairo={v.get('cairo')} "
+              f"pango={v.get('pango')}  {fps:7.1f} fps {rss:7.0f} MB  ttff {ttff:5.2f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all scenes)")
+    parser.add_argument("--full", action="store_true", help="render every section, not the fixed subset")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change flagged as a regression")
+    parser.add_argument("--window", type=int, default=5, help="number of previous runs in the baseline")
+    parser.add_argument("--history", metavar="BENCHMARK", help="print the recorded history of one benchmark")
+    args = parser.parse_args(argv)
+
+    db = open_history()
+    if args.history:
+        print_history(db, args.history)
+        return 0
+
+    scenes = [find_scene(name) for name in args.scenes] if args.scenes else discover_scenes()
+    resolution = f"{RESOLUTION[0]}x{RESOLUTION[1]}@{FRAME_RATE}"
+    versions = library_versions()
+    print(f"Benchmarking at {resolution}: " + ", ".join(f"{k} {v}" for k, v in versions.items() if v))
+
+    measured = []
+    for info in scenes:
+        sections = info.sections if args.full else BENCHMARK_SECTIONS.get(info.name, info.sections)
+        name = info.name if args.full else f"{info.name}:subset"
+        result = run_benchmark(info.name, sections)
+        reference = baseline(db, name, resolution, args.window)
+        flagged = regressions(result, reference, args.threshold) if reference else []
+        measured.append((name, result, flagged))
+        status = "REGRESSION " + "; ".join(flagged) if flagged else ("ok" if reference else "no baseline yet")
+        print(f"{name:<40} {result['fps']:7.1f} fps {result['peak_rss_mb']:7.0f} MB "
+              f"ttff {result['ttff']:5.2f}s  {status}")
+
+    with db:
+        run_id = db.execute(
+            "INSERT INTO runs (started, git_rev, versions) VALUES (?, ?, ?)",
+            (datetime.now(timezone.utc).isoformat(), git_revision(), json.dumps(versions)),
+        ).lastrowid
+        db.executemany(
+            "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(run_id, name, resolution, r["frames"], r["wall"], r["fps"], r["peak_rss_mb"], r["ttff"])
+             for name, r, _ in measured],
+        )
+    return 1 if any(flagged for _, _, flagged in measured) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
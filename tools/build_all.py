@@ -0,0 +1,145 @@
+"""Rebuild every paper video in one go.
+
+All scenes under ``*/main.py`` are discovered and split into sections, and
+the sections of *all* scenes form one global job list.  Jobs are handed to
+the worker pool longest-first (the estimate is the last measured wall time
+of that section, or its video duration scaled by resolution when it has
+never been built: the duration :mod:`tools.timeline` recorded, else one
+estimated from the source), which keeps every core busy until the end.
+Each scene is then joined with a stream copy as in :mod:`tools.render`.
+Sections that are unchanged since their last build are taken from
+:mod:`tools.section_cache`, and all LaTeX is compiled first by
+:mod:`tools.tex_cache`::
+
+    python -m tools.build_all -j 16
+    python -m tools.build_all -q l --scenes BERTBreakthrough GPTPaperAnimation
+    python -m tools.build_all -q h --ladder 720 480 --formats webm gif
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from tools.render import (
+    concat_clips, join_outputs, output_path, render_section, section_jobs, split_cached,
+)
+from tools.scenes import QUALITY_FLAGS, REPO_ROOT, discover_scenes, estimate_duration, video_settings
+from tools.tee import FORMATS
+from tools.tex_cache import precompile
+from tools.timeline import recorded_duration
+
+TIMINGS_FILE = REPO_ROOT / ".build_times.json"
+
+# Seconds of wall time per (second of video x megapixel x frame/s); only used
+# to rank sections that have no measured history yet.
+ESTIMATE_SCALE = 0.02
+
+
+def load_timings():
+    if TIMINGS_FILE.exists():
+        return json.loads(TIMINGS_FILE.read_text())
+    return {}
+
+
+def save_timings(timings):
+    TIMINGS_FILE.write_text(json.dumps(timings, indent=2, sort_keys=True))
+
+
+def timing_key(job):
+    width, height, fps = video_settings(job.config)
+    return f"{job.scene}.{job.section}@{width}x{height}p{fps}"
+
+
+def estimated_cost(info, job, timings):
+    if timing_key(job) in timings:
+        return timings[timing_key(job)]
+    width, height, fps = video_settings(job.config)
+    duration = recorded_duration(info, job.section)
+    if duration is None:
+        duration = estimate_duration(info, job.section)
+    return duration * fps * width * height / 1e6 * ESTIMATE_SCALE
+
+
+def build_all(scenes, quality=None, workers=None, force=False, ladder=(), formats=()):
+    """Render every section of ``scenes`` on one pool and join each scene."""
+    timings = load_timings()
+    by_name = {info.name: info for info in scenes}
+    outputs = {}
+    results = defaultdict(list)
+    jobs = []
+    for info in scenes:
+        scene_jobs = section_jobs(info, quality=quality, ladder=ladder, formats=formats)
+        outputs[info.name] = scene_jobs[0].outputs
+        reused, pending = split_cached(info, scene_jobs, force)
+        results[info.name].extend(reused)
+        jobs.extend(pending)
+    jobs.sort(key=lambda job: estimated_cost(by_name[job.scene], job, timings), reverse=True)
+
+    start = time.perf_counter()
+    precompile([by_name[name] for name in sorted({job.scene for job in jobs})], workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(render_section, job): job for job in jobs}
+        for done, future in enumerate(as_completed(futures), 1):
+            job = futures[future]
+            result = future.result()
+            results[job.scene].append(result)
+            timings[timing_key(job)] = result.wall_time
+            print(f"  [{done}/{len(jobs)}] {job.scene}.{job.section} {result.wall_time:.1f}s")
+    render_wall = time.perf_counter() - start
+    save_timings(timings)
+
+    movies = {}
+    for name, scene_results in results.items():
+        scene_results.sort(key=lambda r: r.index)
+        info = by_name[name]
+        movies[name] = concat_clips(
+            [r.clip for r in scene_results],
+            output_path(info, scene_results[0].quality_dir),
+        )
+        join_outputs(info, outputs[name], scene_results)
+    return results, movies, render_wall, time.perf_counter() - start
+
+
+def print_report(results, movies, render_wall, total_wall, workers):
+    print()
+    print(f"{'job':<60} {'wall':>8}")
+    cpu_total = 0.0
+    for name, scene_results in results.items():
+        scene_total = sum(r.wall_time for r in scene_results)
+        cpu_total += scene_total
+        for r in scene_results:
+            timing = "cached" if r.cached else f"{r.wall_time:6.1f}s"
+            print(f"{name + '.' + r.section:<60} {timing:>8}")
+        print(f"{name + ' (sum)':<60} {scene_total:7.1f}s  -> {movies[name]}")
+    print()
+    print(f"Rendering: {render_wall:.1f}s wall for {cpu_total:.1f}s of jobs on {workers} workers")
+    print(f"Total wall time (including joins): {total_wall:.1f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenes", nargs="+", help="only build these scene classes")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), help="override every script's quality")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--force", action="store_true", help="re-render sections even if they are cached")
+    parser.add_argument("--ladder", nargs="+", type=int, default=(), metavar="HEIGHT",
+                        help="also encode these lower resolutions from the same frames")
+    parser.add_argument("--formats", nargs="+", choices=sorted(FORMATS), default=(),
+                        help="also encode these formats (WebM, GIF preview) from the same frames")
+    args = parser.parse_args(argv)
+
+    scenes = discover_scenes()
+    if args.scenes:
+        missing = set(args.scenes) - {info.name for info in scenes}
+        if missing:
+            parser.error(f"unknown scene(s): {', '.join(sorted(missing))}")
+        scenes = [info for info in scenes if info.name in args.scenes]
+    print(f"Building {len(scenes)} scenes: {', '.join(info.name for info in scenes)}")
+    print_report(*build_all(scenes, args.quality, args.jobs, args.force, args.ladder, args.formats), args.jobs)
+
+
+if __name__ == "__main__":
+    main()
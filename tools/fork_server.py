@@ -0,0 +1,215 @@
+"""Pre-warmed render worker: initialise manim once, fork a child per section.
+
+A fresh render process spends seconds before its first frame: importing
+manim, building Pango's font map and compiling or loading LaTeX.  The server
+pays for all of that once (manim and the ``components`` are imported, a
+``Text`` is laid out, and every scene's TeX is compiled into the shared
+:mod:`tools.tex_cache`) and then forks a child for each submitted section,
+which inherits the warm interpreter and goes straight to building mobjects;
+at most ``-j`` children (one per CPU by default) run at once.
+Jobs are submitted over a ``multiprocessing.connection`` socket; the client
+prints each section's time to first frame (from submission) as soon as the
+child writes it, then the clip::
+
+    python -m tools.fork_server serve &
+    python -m tools.fork_server submit BERTBreakthrough show_bert_architecture
+    python -m tools.fork_server submit GPTPaperAnimation -q l       # every section, in parallel
+
+Children render exactly as :mod:`tools.render` workers do, section cache
+included, so the clips can be joined by ``tools.render`` afterwards.  The
+socket and a per-server authentication key next to it are readable by the
+owner only; connections without the key are refused before anything is
+unpickled.  Unix only (``fork`` and a Unix socket).
+"""
+
+import argparse
+import importlib
+import os
+import pkgutil
+import sys
+import tempfile
+import time
+import traceback
+from multiprocessing.connection import AuthenticationError, Client, Listener, wait
+
+from tools.render import render_section, section_jobs, split_cached
+from tools.scenes import QUALITY_FLAGS, REPO_ROOT, discover_scenes, find_scene
+from tools.tex_cache import precompile
+
+SOCKET = REPO_ROOT / ".cache" / "fork_server.sock"
+
+
+def key_path(address):
+    return address.with_suffix(".key")
+
+
+def _write_key(address):
+    """A fresh authentication key, stored owner-only next to the socket."""
+    key = os.urandom(16)
+    path = key_path(address)
+    path.unlink(missing_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+
+def warm_up():
+    """Do the per-process setup every render needs; returns the seconds it took."""
+    start = time.perf_counter()
+    from manim import Text, tempconfig
+
+    import components
+    import tools.holds  # noqa: F401  (the encoder classes)
+
+    for module in pkgutil.iter_modules(components.__path__):
+        importlib.import_module(f"components.{module.name}")
+    with tempfile.TemporaryDirectory() as media_dir, tempconfig({"media_dir": media_dir}):
+        Text("Warm-up")  # loads fontconfig and Pango's font map
+    precompile(discover_scenes())
+    return time.perf_counter() - start
+
+
+def _run_job(conn, request):
+    """Child body: render the requested section, streaming events to ``conn``."""
+    first_frame = None
+
+    def timed(scene):
+        renderer = scene.renderer
+        add_frame = renderer.add_frame
+
+        def timed_add_frame(frame, num_frames=1):
+            nonlocal first_frame
+            if first_frame is None and not renderer.skip_animations:
+                first_frame = time.time() - request["submitted"]
+                conn.send({"event": "first_frame", "ttff": first_frame})
+            return add_frame(frame, num_frames)
+        renderer.add_frame = timed_add_frame
+
+    try:
+        info = find_scene(request["scene"])
+        jobs = section_jobs(info, [request["section"]], request["quality"])
+        reused, pending = split_cached(info, jobs, request["force"])
+        result = reused[0] if reused else render_section(pending[0], timed)
+        conn.send({"event": "done", "clip": result.clip, "cached": result.cached,
+                   "wall": time.time() - request["submitted"], "ttff": first_frame})
+    except Exception:
+        conn.send({"event": "error", "error": traceback.format_exc()})
+
+
+def _reap(children, block=False):
+    """Drop finished children from ``children``; with ``block``, wait for one first."""
+    try:
+        pid, _ = os.waitpid(-1, 0 if block else os.WNOHANG)
+        while pid:
+            children.discard(pid)
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+    except ChildProcessError:
+        children.clear()
+
+
+def serve(address=SOCKET, max_children=None):
+    """Warm up, then fork a child per job, at most ``max_children`` at a time."""
+    max_children = max_children or os.cpu_count() or 1
+    print("warming up ...", flush=True)
+    ready = warm_up()
+    address.parent.mkdir(parents=True, exist_ok=True)
+    if address.exists():
+        address.unlink()
+    authkey = _write_key(address)
+    children = set()
+    # Bind owner-only, so the socket is never connectable by others.
+    umask = os.umask(0o177)
+    try:
+        listener = Listener(str(address), family="AF_UNIX", authkey=authkey)
+    finally:
+        os.umask(umask)
+    os.chmod(address, 0o600)
+    with listener:
+        print(f"ready in {ready:.1f}s, listening on {address}", flush=True)
+        try:
+            while True:
+                try:
+                    conn = listener.accept()
+                except (AuthenticationError, OSError) as error:
+                    print(f"refused a connection: {error}", flush=True)
+                    continue
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    conn.close()
+                    continue
+                _reap(children)
+                while len(children) >= max_children:
+                    # Further jobs queue on the socket meanwhile.
+                    _reap(children, block=True)
+                pid = os.fork()
+                if pid == 0:
+                    try:
+                        _run_job(conn, request)
+                    finally:
+                        sys.stdout.flush()
+                        sys.stderr.flush()
+                        # Skip exit handlers: the listener's would remove the server's socket.
+                        os._exit(0)
+                children.add(pid)
+                conn.close()
+                print(f"{request['scene']}.{request['section']}: forked {pid}", flush=True)
+        except KeyboardInterrupt:
+            pass
+
+
+def submit(scene, sections=None, quality=None, force=False, address=SOCKET):
+    """Render ``sections`` of ``scene`` on the server, in parallel; returns ``{section: final event}``."""
+    info = find_scene(scene)
+    authkey = key_path(address).read_bytes()
+    pending = {}
+    for section in sections or info.sections:
+        conn = Client(str(address), family="AF_UNIX", authkey=authkey)
+        conn.send({"scene": info.name, "section": section, "quality": quality, "force": force,
+                   "submitted": time.time()})
+        pending[conn] = section
+    results = {}
+    while pending:
+        for conn in wait(list(pending)):
+            section = pending[conn]
+            try:
+                event = conn.recv()
+            except EOFError:
+                event = {"event": "error", "error": "the worker exited without a result"}
+            if event["event"] == "first_frame":
+                print(f"  {section:<40} first frame after {event['ttff']:.2f}s")
+                continue
+            if event["event"] == "done":
+                status = "cached" if event["cached"] else f"done in {event['wall']:.1f}s"
+                print(f"  {section:<40} {status}: {event['clip']}")
+            else:
+                print(f"  {section:<40} failed\n{event['error']}")
+            results[section] = event
+            conn.close()
+            del pending[conn]
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    server = commands.add_parser("serve", help="warm up and wait for jobs")
+    server.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="sections rendered at the same time; more are queued")
+    client = commands.add_parser("submit", help="render sections on the running server")
+    client.add_argument("scene", help="scene class name, e.g. BERTBreakthrough")
+    client.add_argument("sections", nargs="*", help="sections to render (default: all)")
+    client.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), help="override the script's quality")
+    client.add_argument("--force", action="store_true", help="render even if the section is cached")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(max_children=args.jobs)
+        return 0
+    results = submit(args.scene, args.sections, args.quality, args.force)
+    return 1 if any(event["event"] == "error" for event in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""Single frames of a section at given times, without playing the rest of the scene.
+
+Every section of the paper scenes starts from a cleared screen, so the state
+at a time inside one section only depends on that section.  The section is
+run alone, with manim's animation skipping and without rasterising, until
+the ``play``/``wait`` the time falls into; that animation is interpolated to
+the exact offset and only then is a frame drawn::
+
+    from tools.frames import render_frame
+    rgb = render_frame("LlamaThreeAnimation", "results_and_impact", 8.0)   # (480, 854, 3) uint8
+
+    python -m tools.frames LlamaThreeAnimation results_and_impact 8 12.5 -q m
+
+Times are seconds from the start of the section, as in the section's clip.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from tools.render import configured_scene, skip_rasterisation
+from tools.scenes import QUALITY_FLAGS, find_scene, section_scene
+
+
+class _FramesCaptured(Exception):
+    """Raised once every requested frame is captured, to stop the section early."""
+
+
+class FrameGrabber:
+    """Captures the frames of an attached scene at ``times`` into ``section``."""
+
+    def __init__(self, section, times):
+        self.section = section
+        self.pending = sorted(set(times))
+        self.frames = {}
+        self.start = None  # scene time at which the section starts
+        self.duration = 0.0
+
+    def attach(self, scene):
+        renderer = scene.renderer
+        draw = renderer.update_frame
+        skip_rasterisation(renderer)
+        play = scene.play
+        update_to_time = scene.update_to_time
+
+        def capture(upto, inclusive=False):
+            """Frame of the current state for every pending time before ``upto``."""
+            frame = None
+            while self.pending and (self.pending[0] < upto or inclusive and self.pending[0] == upto):
+                if frame is None:
+                    draw(scene)
+                    frame = renderer.get_frame()[:, :, :3].copy()
+                self.frames[self.pending.pop(0)] = frame
+            if not self.pending:
+                raise _FramesCaptured
+
+        def timed_update(t):
+            # Skipping evaluates each animation once, at its end; renderer.time
+            # already includes it.
+            if scene.current_section == self.section and self.start is not None:
+                begin = renderer.time - scene.duration - self.start
+                while self.pending and self.pending[0] < begin + t:
+                    update_to_time(self.pending[0] - begin)
+                    capture(self.pending[0], inclusive=True)
+            update_to_time(t)
+
+        def sampled_play(*args, **kwargs):
+            if scene.current_section != self.section:
+                return play(*args, **kwargs)
+            if self.start is None:
+                self.start = renderer.time
+            play(*args, **kwargs)
+            self.duration = renderer.time - self.start
+            # Frozen waits and finished animations: the state is static up to here.
+            capture(self.duration)
+
+        scene.update_to_time = timed_update
+        scene.play = sampled_play
+        return scene
+
+
+def render_frames(scene, section, times, quality="l", resolution=None):
+    """RGB frames (``uint8``, rows × columns × 3) of ``section`` at ``times``.
+
+    ``scene`` is a scene class or its name.  ``resolution`` is a
+    ``(width, height)`` overriding the quality's.  Returns ``{time: frame}``;
+    a time at or past the end of the section raises :class:`ValueError`.
+    """
+    info = find_scene(scene if isinstance(scene, str) else scene.__name__)
+    if section not in info.sections:
+        raise KeyError(f"{info.name} has no section {section!r}")
+    if min(times) < 0:
+        raise ValueError("frame times must not be negative")
+    overrides = {"dry_run": True, "disable_caching": True}
+    if resolution:
+        overrides.update(pixel_width=resolution[0], pixel_height=resolution[1])
+    grabber = FrameGrabber(section, times)
+    with configured_scene(info, info.render_config(quality), **overrides) as scene_cls:
+        instance = section_scene(scene_cls, [section])(skip_animations=True)
+        grabber.attach(instance)
+        try:
+            instance.render()
+        except _FramesCaptured:
+            return grabber.frames
+    raise ValueError(f"{info.name}.{section} is {grabber.duration:.2f}s long; no frame at "
+                     f"{', '.join(f'{t:g}s' for t in grabber.pending)}")
+
+
+def render_frame(scene, section, t, quality="l", resolution=None):
+    """RGB frame of ``section`` at ``t`` seconds into it; see :func:`render_frames`."""
+    return render_frames(scene, section, [t], quality, resolution)[t]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scene", help="scene class name, e.g. LlamaThreeAnimation")
+    parser.add_argument("section", help="section method, e.g. results_and_impact")
+    parser.add_argument("times", nargs="+", type=float, help="seconds into the section")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), default="l",
+                        help="resolution of the frames (default: l)")
+    parser.add_argument("-o", "--output-dir", help="where to write the PNGs (default: <paper>/media/frames/)")
+    args = parser.parse_args(argv)
+
+    from PIL import Image
+
+    info = find_scene(args.scene)
+    start = time.perf_counter()
+    frames = render_frames(info.name, args.section, args.times, args.quality)
+    output_dir = Path(args.output_dir or info.directory / "media" / "frames" / info.name)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for t, frame in frames.items():
+        path = output_dir / f"{args.section}_{t:07.2f}.png"
+        Image.fromarray(frame).save(path)
+        print(f"  {path}")
+    print(f"{len(frames)} frame(s) in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
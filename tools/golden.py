@@ -0,0 +1,191 @@
+"""Golden-frame check: sample frames of every section, compared by perceptual hash.
+
+A few frames of each section (at fixed fractions of its duration) are
+rendered at 320x180 with :func:`tools.frames.render_frames`, which builds
+only that section and draws only the sampled frames, and their perceptual
+hashes are compared with the ones recorded under ``golden/``.  A frame
+whose hash is more than ``--max-distance`` bits away has drifted; the
+section is reported and the new frame is written to
+``<paper>/media/golden/``, under the name of the golden PNG it differs from::
+
+    python -m tools.golden                    # check every scene; exit status 1 on drift
+    python -m tools.golden GPTPaperAnimation --sections training_process
+    python -m tools.golden --update           # record (after an intended change)
+
+A section without recorded frames is skipped with a warning (``--strict``
+makes it a failure, for CI once ``golden/`` is recorded).  Sample times are
+recorded with the hashes, so a section whose timing changes keeps being
+compared at the same instants until it is re-recorded.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from tools.scenes import REPO_ROOT, discover_scenes, find_scene
+
+GOLDEN_DIR = REPO_ROOT / "golden"
+RESOLUTION = (320, 180)
+SAMPLE_FRACTIONS = (0.25, 0.5, 0.9)
+HASH_SIZE = 16  # a HASH_SIZE² bit hash
+MAX_DISTANCE = 12
+
+
+def perceptual_hash(frame, hash_size=HASH_SIZE):
+    """DCT hash of an RGB frame, as hex: the signs of its lowest frequencies against their median."""
+    import numpy as np
+    from PIL import Image
+
+    size = hash_size * 4
+    gray = np.asarray(Image.fromarray(frame).convert("L").resize((size, size), Image.LANCZOS), dtype=float)
+    n = np.arange(size)
+    dct = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size))
+    low = (dct @ gray @ dct.T)[:hash_size, :hash_size]
+    return np.packbits(low > np.median(low)).tobytes().hex()
+
+
+def hash_distance(a, b):
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+def golden_file(info):
+    return GOLDEN_DIR / f"{info.name}.json"
+
+
+def frame_name(section, t):
+    return f"{section}@{t:07.2f}s.png"
+
+
+def load_golden(info):
+    path = golden_file(info)
+    return json.loads(path.read_text()) if path.exists() else {"resolution": list(RESOLUTION), "sections": {}}
+
+
+def _sample(job):
+    """Worker: ``(scene, section, times)`` -> ``{time: frame}``, or the error message."""
+    from tools.frames import render_frames
+
+    scene, section, times = job
+    try:
+        return render_frames(scene, section, times, resolution=RESOLUTION)
+    except Exception as error:  # reported per section
+        return f"{type(error).__name__}: {error}"
+
+
+def sample_all(jobs, workers=None):
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(zip([job[:2] for job in jobs], pool.map(_sample, jobs)))
+
+
+def update(scenes, sections=None, workers=None):
+    """Record the golden frames of ``scenes``' (selected) sections."""
+    from PIL import Image
+
+    from tools.timeline import build_timeline
+
+    jobs = []
+    for info in scenes:
+        durations = build_timeline(info, sections)["sections"]
+        for section in info.sections:
+            if section in durations and (not sections or section in sections):
+                duration = durations[section]["duration"]
+                jobs.append((info.name, section, [round(duration * f, 2) for f in SAMPLE_FRACTIONS]))
+    samples = sample_all(jobs, workers)
+
+    for info in scenes:
+        golden = load_golden(info)
+        for (scene, section), frames in samples.items():
+            if scene != info.name:
+                continue
+            if isinstance(frames, str):
+                print(f"{scene}.{section}: not recorded, {frames}")
+                continue
+            (GOLDEN_DIR / scene).mkdir(parents=True, exist_ok=True)
+            golden["sections"][section] = {}
+            for t, frame in frames.items():
+                golden["sections"][section][f"{t:g}"] = perceptual_hash(frame)
+                Image.fromarray(frame).save(GOLDEN_DIR / scene / frame_name(section, t))
+            print(f"{scene}.{section}: recorded {len(frames)} frame(s)")
+        golden["sections"] = {s: golden["sections"][s] for s in info.sections if s in golden["sections"]}
+        golden_file(info).write_text(json.dumps(golden, indent=2))
+
+
+def check(scenes, sections=None, workers=None, max_distance=MAX_DISTANCE):
+    """Compare ``scenes`` with their golden frames.
+
+    Returns ``(failed, unrecorded)``: the ``(scene, section)`` pairs that
+    drifted or failed to render, and those with no golden frames to compare.
+    """
+    from PIL import Image
+
+    jobs, unrecorded = [], []
+    for info in scenes:
+        recorded = load_golden(info)["sections"]
+        for section in info.sections:
+            if sections and section not in sections:
+                continue
+            if section in recorded:
+                jobs.append((info.name, section, [float(t) for t in recorded[section]]))
+            else:
+                unrecorded.append((info.name, section))
+    samples = sample_all(jobs, workers)
+
+    drifted = []
+    for info in scenes:
+        recorded = load_golden(info)["sections"]
+        for (scene, section), frames in samples.items():
+            if scene != info.name:
+                continue
+            if isinstance(frames, str):
+                drifted.append((scene, section))
+                print(f"  FAIL  {scene}.{section}: {frames}")
+                continue
+            distances = {t: hash_distance(perceptual_hash(frame), recorded[section][f"{t:g}"])
+                         for t, frame in frames.items()}
+            changed = {t: d for t, d in distances.items() if d > max_distance}
+            if not changed:
+                print(f"  ok    {scene}.{section}  (max {max(distances.values())} bits)")
+                continue
+            drifted.append((scene, section))
+            output_dir = info.directory / "media" / "golden" / scene
+            output_dir.mkdir(parents=True, exist_ok=True)
+            for t in changed:
+                Image.fromarray(frames[t]).save(output_dir / frame_name(section, t))
+            print(f"  DRIFT {scene}.{section}  "
+                  + ", ".join(f"{t:g}s: {d} bits" for t, d in changed.items())
+                  + f"  -> {output_dir}")
+    for scene, section in unrecorded:
+        print(f"  SKIP  {scene}.{section}: no golden frames, record them with --update")
+    return drifted, unrecorded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all scenes)")
+    parser.add_argument("--sections", nargs="+", help="only these sections")
+    parser.add_argument("--update", action="store_true", help="record the golden frames instead of checking")
+    parser.add_argument("--strict", action="store_true", help="fail on sections without golden frames")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--max-distance", type=int, default=MAX_DISTANCE,
+                        help=f"hash bits (of {HASH_SIZE ** 2}) a frame may differ by (default: {MAX_DISTANCE})")
+    args = parser.parse_args(argv)
+
+    scenes = [find_scene(name) for name in args.scenes] if args.scenes else discover_scenes()
+    start = time.perf_counter()
+    if args.update:
+        update(scenes, args.sections, args.jobs)
+        print(f"golden frames written to {GOLDEN_DIR} in {time.perf_counter() - start:.1f}s")
+        return 0
+    drifted, unrecorded = check(scenes, args.sections, args.jobs, args.max_distance)
+    print(f"{len(drifted)} section(s) drifted, {len(unrecorded)} skipped, "
+          f"checked in {time.perf_counter() - start:.1f}s")
+    if unrecorded:
+        print(f"warning: {len(unrecorded)} section(s) have no golden frames in {GOLDEN_DIR}", file=sys.stderr)
+    return 1 if drifted or (args.strict and unrecorded) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
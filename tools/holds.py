@@ -0,0 +1,83 @@
+"""Encode static holds (``self.wait(n)`` with nothing moving) as one long frame.
+
+manim's Cairo renderer already rasterises a frozen wait once and hands the
+frame to the encoder with ``repeat=n``, but the encoder then converts and
+encodes that picture once per output frame: a ``self.wait(3)`` at 60 fps is
+180 RGBA->YUV conversions and encoder calls for a single image.  Every
+play/wait goes to its own partial movie file, so a segment made of one frame
+repeated ``n`` times is written here as a single frame whose packet lasts
+``n`` frame durations.  The segment keeps its exact length, and the stream
+copies that join segments and sections preserve the timing.
+
+Render workers use this through :func:`hold_renderer`.
+"""
+
+from fractions import Fraction
+
+from manim import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.scene.video_segment_encoder import VideoSegmentEncoder
+
+
+class HoldSegmentEncoder(VideoSegmentEncoder):
+    """Segment encoder that writes a segment of one repeated frame as one sample."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._hold = None
+
+    def write_frame(self, pixels, *, repeat=1):
+        if self._hold is None and self._next_pts == 0 and repeat > 1:
+            # Defer: this is only a hold if nothing else follows in the segment.
+            self._validate_frame(pixels, repeat)
+            self._hold = (pixels, repeat)
+            return
+        self._flush_hold()
+        super().write_frame(pixels, repeat=repeat)
+
+    def _flush_hold(self):
+        if self._hold is not None:
+            pixels, repeat = self._hold
+            self._hold = None
+            super().write_frame(pixels, repeat=repeat)
+
+    def finish(self):
+        if self._hold is None or self._closed:
+            return super().finish()
+        import av
+
+        pixels, repeat = self._hold
+        self._hold = None
+        frame_rate = Fraction(self.spec.frame_rate)
+        frame = av.VideoFrame.from_ndarray(pixels, format="rgba")
+        frame.pts = 0
+        frame.time_base = 1 / frame_rate
+        try:
+            packets = list(self._stream.encode(frame)) + list(self._stream.encode())
+            for packet in packets:
+                packet.duration = int(repeat / frame_rate / packet.time_base)
+                self._container.mux(packet)
+        except Exception as error:
+            self.abort()
+            raise self._operation_error("encode", error) from error
+        self._closed = True
+        try:
+            self._container.close()
+        except Exception as error:
+            raise self._operation_error("finish", error) from error
+
+    def abort(self):
+        self._hold = None
+        super().abort()
+
+
+class HoldFileWriter(SceneFileWriter):
+    def _create_segment_encoder(self, target):
+        if self.video_encoder is None:
+            return super()._create_segment_encoder(target)
+        return HoldSegmentEncoder(target=target, spec=self.video_encoder)
+
+
+def hold_renderer(**kwargs):
+    """A Cairo renderer whose segments are written by :class:`HoldFileWriter`."""
+    return CairoRenderer(file_writer_class=HoldFileWriter, **kwargs)
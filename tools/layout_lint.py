@@ -0,0 +1,193 @@
+"""Layout lint: overlapping and off-frame mobjects, found without rendering.
+
+Each section is constructed as in a render, but animations are evaluated
+once at their end time (manim's skipping), nothing is rasterised or encoded
+and ``self.wait`` returns immediately.  At every ``play``/``wait`` the
+bounding boxes of the mobjects on screen are checked:
+
+* **overlap**: two top-level mobjects (each ``self.add``/``play`` target is
+  one group) whose boxes intersect without one containing the other, so a
+  label inside its own box is fine but a caption running into a diagram is
+  reported;
+* **off-frame**: a mobject extending past the edge of the frame.
+
+Each problem is reported once, at the line of the first ``play``/``wait``
+it is visible at::
+
+    python -m tools.layout_lint
+    python -m tools.layout_lint DeepSeekR1Animation --sections grpo_algorithm
+
+The exit status is 1 when anything was reported.
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from tools.render import configured_scene, skip_rasterisation
+from tools.scenes import REPO_ROOT, discover_scenes, find_scene, section_scene
+
+# Intersections thinner than this (scene units) are edges touching, not overlaps.
+OVERLAP_TOLERANCE = 0.05
+OFF_FRAME_TOLERANCE = 0.01
+
+
+@dataclass
+class LayoutIssue:
+    section: str
+    location: str  # "path:line" of the play/wait the issue first shows at
+    kind: str      # "overlap" or "off-frame"
+    subjects: tuple
+    detail: str
+
+    def __str__(self):
+        return f"{self.location}  {self.kind}  {' × '.join(self.subjects)}  ({self.detail})"
+
+
+def describe(mobject):
+    """Short name for a mobject: its class and the first text it contains."""
+    for member in mobject.get_family():
+        text = getattr(member, "tex_string", None) or getattr(member, "text", None)
+        if isinstance(text, str) and text.strip():
+            text = " ".join(text.split())
+            return f'{type(mobject).__name__} "{text[:32]}{"…" if len(text) > 32 else ""}"'
+    return type(mobject).__name__
+
+
+def is_visible(mobject):
+    from manim import VMobject
+
+    for member in mobject.family_members_with_points():
+        if not isinstance(member, VMobject):
+            return True
+        if member.get_fill_opacity() > 0 or (member.get_stroke_opacity() > 0 and member.get_stroke_width() > 0):
+            return True
+    return False
+
+
+def bounding_box(mobject):
+    """``(left, bottom, right, top)`` of all points in ``mobject``'s family."""
+    import numpy as np
+
+    points = np.concatenate([member.points for member in mobject.family_members_with_points()])
+    (left, bottom), (right, top) = points[:, :2].min(axis=0), points[:, :2].max(axis=0)
+    return left, bottom, right, top
+
+
+def _contains(outer, inner, tolerance):
+    return (outer[0] - tolerance <= inner[0] and outer[1] - tolerance <= inner[1]
+            and inner[2] <= outer[2] + tolerance and inner[3] <= outer[3] + tolerance)
+
+
+def layout_issues(mobjects, frame_box, overlap_tolerance=OVERLAP_TOLERANCE,
+                  off_frame_tolerance=OFF_FRAME_TOLERANCE):
+    """``(kind, subjects, detail)`` for every problem among the on-screen ``mobjects``."""
+    shown = [(mobject, bounding_box(mobject)) for mobject in mobjects
+             if mobject.family_members_with_points() and is_visible(mobject)]
+    issues = []
+    left, bottom, right, top = frame_box
+    for mobject, box in shown:
+        beyond = {
+            "left": left - box[0], "bottom": bottom - box[1], "right": box[2] - right, "top": box[3] - top,
+        }
+        edges = [f"{edge} by {distance:.2f}" for edge, distance in beyond.items() if distance > off_frame_tolerance]
+        if edges:
+            issues.append(("off-frame", (describe(mobject),), "past the " + ", ".join(edges)))
+
+    for i, (first, a) in enumerate(shown):
+        for second, b in shown[i + 1:]:
+            width = min(a[2], b[2]) - max(a[0], b[0])
+            height = min(a[3], b[3]) - max(a[1], b[1])
+            if width <= overlap_tolerance or height <= overlap_tolerance:
+                continue
+            if _contains(a, b, overlap_tolerance) or _contains(b, a, overlap_tolerance):
+                continue
+            issues.append(("overlap", (describe(first), describe(second)), f"{width:.2f} × {height:.2f}"))
+    return issues
+
+
+class LayoutLint:
+    """Checks an attached scene's layout at every ``play``/``wait``."""
+
+    def __init__(self):
+        self.issues = []
+        self.checks = 0
+        self._seen = set()
+
+    def attach(self, scene):
+        renderer = scene.renderer
+        camera = renderer.camera
+        play = scene.play
+
+        # Bounding boxes only need the mobjects' points.
+        skip_rasterisation(renderer)
+
+        def check():
+            caller = sys._getframe(2)
+            path = Path(caller.f_code.co_filename)
+            try:
+                path = path.relative_to(REPO_ROOT)
+            except ValueError:
+                pass
+            center = camera.frame_center
+            frame_box = (center[0] - camera.frame_width / 2, center[1] - camera.frame_height / 2,
+                         center[0] + camera.frame_width / 2, center[1] + camera.frame_height / 2)
+            self.checks += 1
+            for kind, subjects, detail in layout_issues(scene.mobjects + scene.foreground_mobjects, frame_box):
+                key = (scene.current_section, kind, subjects)
+                if key not in self._seen:
+                    self._seen.add(key)
+                    self.issues.append(LayoutIssue(
+                        scene.current_section, f"{path}:{caller.f_lineno}", kind, subjects, detail,
+                    ))
+
+        def linted_play(*args, **kwargs):
+            play(*args, **kwargs)
+            check()
+
+        def linted_wait(*args, **kwargs):
+            check()
+
+        scene.play = linted_play
+        scene.wait = linted_wait
+        return scene
+
+
+def lint_scene(info, sections=None):
+    """Construct ``info``'s sections without rendering; returns ``(issues, checks)``."""
+    settings = info.render_config("l")
+    lint = LayoutLint()
+    with configured_scene(info, settings, dry_run=True, disable_caching=True) as scene_cls:
+        scene = section_scene(scene_cls, sections or info.sections)(skip_animations=True)
+        lint.attach(scene)
+        scene.render()
+    return lint.issues, lint.checks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all scenes)")
+    parser.add_argument("--sections", nargs="+", help="only these sections")
+    args = parser.parse_args(argv)
+
+    scenes = [find_scene(name) for name in args.scenes] if args.scenes else discover_scenes()
+    total = 0
+    for info in scenes:
+        start = time.perf_counter()
+        issues, checks = lint_scene(info, args.sections)
+        print(f"{info.name}: {len(issues)} issue(s) in {checks} play/wait checks, "
+              f"{time.perf_counter() - start:.1f}s")
+        for section in info.sections:
+            found = [issue for issue in issues if issue.section == section]
+            if found:
+                print(f"  {section}")
+                for issue in found:
+                    print(f"    {issue}")
+        total += len(issues)
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""Per-play and per-section wall-clock profile of a scene render.
+
+Every ``self.play`` and ``self.wait`` of the scene is wrapped, and for each
+call the report records
+
+* the section method it came from and the animation types played,
+* how many mobjects were on screen (top level and whole family),
+* ``build`` - time spent in the section's own code since the previous call,
+  i.e. constructing ``Text``/``MathTex``/geometry before this call,
+* ``raster`` - time in the camera (``renderer.update_frame``),
+* ``encode`` - time in the video encoder for this call's segment.  Encoding
+  runs on a background thread, so it overlaps with the next call's work,
+* ``wall`` - total time inside the call, and the number of frames written.
+
+The result is written as JSON and summarised per section::
+
+    python -m tools.profiler LlamaThreeAnimation -q l
+    python -m tools.profiler                      # every scene
+"""
+
+import argparse
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from tools.render import configured_scene
+from tools.scenes import QUALITY_FLAGS, discover_scenes, find_scene, section_scene
+
+
+class Profiler:
+    """Collects one record per ``play``/``wait`` call of an attached scene."""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+        self._encode = defaultdict(float)
+        self._depth = 0
+        self._mark = time.perf_counter()
+        self._raster = 0.0
+        self._frames = 0
+
+    def attach(self, scene):
+        """Wrap ``scene``'s play/wait and its renderer's hot paths."""
+        renderer = scene.renderer
+        self._wrap_call(scene, "play")
+        self._wrap_call(scene, "wait")
+
+        update_frame = renderer.update_frame
+
+        def timed_update_frame(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return update_frame(*args, **kwargs)
+            finally:
+                self._raster += time.perf_counter() - start
+        renderer.update_frame = timed_update_frame
+
+        add_frame = renderer.add_frame
+
+        def counted_add_frame(frame, num_frames=1):
+            if not renderer.skip_animations:
+                self._frames += num_frames
+            return add_frame(frame, num_frames)
+        renderer.add_frame = counted_add_frame
+
+        self._wrap_encoder(renderer.file_writer)
+        return scene
+
+    def _wrap_call(self, scene, kind):
+        original = getattr(scene, kind)
+
+        def profiled(*args, **kwargs):
+            if self._depth:
+                # wait() is implemented with play(); only record the outer call.
+                return original(*args, **kwargs)
+            self._depth += 1
+            start = time.perf_counter()
+            build = start - self._mark
+            self._raster, self._frames = 0.0, 0
+            try:
+                return original(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                self._depth -= 1
+                self.calls.append({
+                    "index": len(self.calls),
+                    "section": getattr(scene, "current_section", None),
+                    "kind": kind,
+                    "animations": [type(a).__name__ for a in scene.animations or []],
+                    "mobjects": len(scene.mobjects),
+                    "family_mobjects": len(scene.get_mobject_family_members()),
+                    "frames": self._frames,
+                    "build": build,
+                    "raster": self._raster,
+                    "encode": 0.0,
+                    "wall": end - start,
+                })
+                self._mark = end
+        setattr(scene, kind, profiled)
+
+    def _wrap_encoder(self, file_writer):
+        """Time the encoder, attributing work to the call that produced it."""
+        def timed(function, call_index):
+            def wrapper(*args, **kwargs):
+                index = len(self.calls) if call_index is None else call_index
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    with self._lock:
+                        self._encode[index] += time.perf_counter() - start
+            return wrapper
+
+        create = getattr(file_writer, "_create_segment_encoder", None)
+        if create is None:
+            # Writers without per-segment encoders encode synchronously,
+            # inside the call that is currently running.
+            file_writer.write_frame = timed(file_writer.write_frame, None)
+            return
+
+        def create_timed_encoder(*args, **kwargs):
+            encoder = create(*args, **kwargs)
+            encoder.write_frame = timed(encoder.write_frame, len(self.calls))
+            encoder.finish = timed(encoder.finish, len(self.calls))
+            return encoder
+        file_writer._create_segment_encoder = create_timed_encoder
+
+    def report(self, scene_name, settings):
+        """The JSON-serialisable report; call after ``scene.render()``."""
+        for call in self.calls:
+            call["encode"] = self._encode.get(call["index"], 0.0)
+        return {
+            "scene": scene_name,
+            "config": dict(settings),
+            "calls": self.calls,
+            "sections": summarize(self.calls),
+        }
+
+
+def summarize(calls):
+    sections = {}
+    for call in calls:
+        summary = sections.setdefault(call["section"] or "<construct>", {
+            "plays": 0, "waits": 0, "frames": 0,
+            "build": 0.0, "raster": 0.0, "encode": 0.0, "wall": 0.0,
+        })
+        summary["plays" if call["kind"] == "play" else "waits"] += 1
+        for key in ("frames", "build", "raster", "encode", "wall"):
+            summary[key] += call[key]
+    return sections
+
+
+def format_table(report):
+    columns = ("plays", "waits", "frames", "build", "raster", "encode", "wall")
+    lines = [f"{report['scene']}",
+             f"{'section':<36}" + "".join(f"{c:>9}" for c in columns)]
+    totals = defaultdict(float)
+    for name, summary in report["sections"].items():
+        cells = []
+        for column in columns:
+            totals[column] += summary[column]
+            value = summary[column]
+            cells.append(f"{value:9d}" if isinstance(value, int) else f"{value:8.2f}s")
+        lines.append(f"{name:<36}" + "".join(cells))
+    lines.append(f"{'total':<36}" + "".join(
+        f"{int(totals[c]):9d}" if c in ("plays", "waits", "frames") else f"{totals[c]:8.2f}s"
+        for c in columns
+    ))
+    slowest = sorted(report["calls"], key=lambda c: c["build"] + c["wall"], reverse=True)[:5]
+    lines.append("slowest calls:")
+    for call in slowest:
+        lines.append(f"  #{call['index']:<4} {call['section']}: {call['kind']} "
+                     f"{', '.join(call['animations'])} build={call['build']:.2f}s wall={call['wall']:.2f}s")
+    return "\n".join(lines)
+
+
+def profile_scene(info, sections=None, quality=None, output=None):
+    """Render ``info`` in this process with a :class:`Profiler` attached."""
+    settings = info.render_config(quality)
+    profiler = Profiler()
+    with configured_scene(info, settings, disable_caching=True) as scene_cls:
+        scene = section_scene(scene_cls, sections or info.sections)()
+        profiler.attach(scene)
+        scene.render()
+    report = profiler.report(info.name, settings)
+    output = Path(output or info.directory / "media" / "profiles" / f"{info.name}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    return report, output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all scenes)")
+    parser.add_argument("--sections", nargs="+", help="only profile these sections")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), help="override the script's quality")
+    parser.add_argument("-o", "--output", help="report path (single scene only)")
+    args = parser.parse_args(argv)
+
+    scenes = [find_scene(name) for name in args.scenes] if args.scenes else discover_scenes()
+    if args.output and len(scenes) > 1:
+        parser.error("--output needs exactly one scene")
+    for info in scenes:
+        report, path = profile_scene(info, args.sections, args.quality, args.output)
+        print(format_table(report))
+        print(f"report written to {path}\n")
+
+
+if __name__ == "__main__":
+    main()
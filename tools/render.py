@@ -0,0 +1,275 @@
+"""Render a scene section-by-section on a process pool.
+
+Each section of a paper scene clears the screen when it is done, so the
+sections can be rendered as independent jobs and their clips joined with an
+ffmpeg stream copy (no re-encode)::
+
+    python -m tools.render LlamaThreeAnimation -q h -j 16
+    python -m tools.render BERTBreakthrough --sections show_bert_architecture
+    python -m tools.render LlamaThreeAnimation --ladder 720 480   # + 720p/480p rungs
+    python -m tools.render GPTPaperAnimation --formats webm gif    # + VP9 WebM, GIF preview
+
+Sections whose code, constants and config are unchanged since their last
+render are reused from :mod:`tools.section_cache`; pass ``--force`` to
+render them anyway.  ``--ladder`` and ``--formats`` encode lower resolutions
+and other codecs from the same frames as the master (see :mod:`tools.tee`).
+The scene's LaTeX is compiled up front by :mod:`tools.tex_cache`, so no
+worker waits on a TeX subprocess, and static ``wait`` holds are encoded as
+single long frames (:mod:`tools.holds`).
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from tools import section_cache
+from tools.tee import COPY_JOIN, FORMATS, FrameTee, ladder_outputs
+from tools.tex_cache import TEX_DIR, precompile
+from tools.scenes import (
+    QUALITY_FLAGS, find_scene, load_scene_class, parse_scene_file, quality_dir, section_scene,
+)
+
+
+@dataclass
+class SectionJob:
+    """Everything a worker process needs to render one section."""
+    scene: str
+    path: str
+    index: int
+    section: str
+    config: list
+    cache_key: str = ""
+    outputs: tuple = ()
+
+
+@dataclass
+class SectionResult:
+    section: str
+    index: int
+    clip: str
+    quality_dir: str
+    wall_time: float
+    cached: bool = False
+    outputs: dict = field(default_factory=dict)
+
+
+def clip_name(job):
+    return f"{job.index:02d}_{job.section}"
+
+
+@contextmanager
+def configured_scene(info, settings, **overrides):
+    """Load ``info``'s scene class with ``settings`` applied to manim's config.
+
+    Importing the script applies its module-level config; the replayed
+    assignments, then ``overrides``, take precedence.  The scene runs in the
+    script's directory; the working directory and the global config are
+    restored on exit.
+    """
+    from manim import config, tempconfig
+
+    cwd = os.getcwd()
+    os.chdir(info.directory)
+    try:
+        with tempconfig({}):
+            scene_cls = load_scene_class(info)
+            for key, value in settings:
+                config[key] = value
+            config.preview = False
+            config.media_dir = str(info.directory / "media")
+            # Shared with tools.tex_cache; LaTeX's cleanup would race other workers.
+            config.tex_dir = str(TEX_DIR)
+            config.no_latex_cleanup = True
+            for key, value in overrides.items():
+                config[key] = value
+            yield scene_cls
+    finally:
+        os.chdir(cwd)
+
+
+def skip_rasterisation(renderer):
+    """Stop ``renderer`` from drawing frames; plays and waits still advance the scene."""
+    def no_frame(*args, **kwargs):
+        return None
+    renderer.update_frame = no_frame
+    renderer.render = no_frame
+    renderer.save_static_frame_data = no_frame
+    renderer.freeze_current_frame = no_frame
+    return renderer
+
+
+def sections_dir(info, name):
+    return info.directory / "media" / "sections" / info.name / name
+
+
+def render_section(job, attach=None):
+    """Render a single section to its own clip.  Runs inside a worker.
+
+    Extra ``job.outputs`` are encoded from the same frames by a
+    :class:`tools.tee.FrameTee`; manim's per-play cache is disabled for them.
+    ``attach``, if given, is called with the scene before it renders.
+    """
+    start = time.perf_counter()
+    info = next(s for s in parse_scene_file(job.path) if s.name == job.scene)
+    resolution = quality_dir(job.config)
+    overrides = {"disable_caching": True} if job.outputs else {}
+    tee = FrameTee(job.outputs, [
+        sections_dir(info, output.name) / f"{clip_name(job)}{output.suffix}" for output in job.outputs
+    ])
+    with configured_scene(info, job.config, video_dir=str(sections_dir(info, resolution)),
+                          output_file=clip_name(job), **overrides) as scene_cls:
+        from tools.holds import hold_renderer
+
+        scene = section_scene(scene_cls, [job.section])(renderer=hold_renderer())
+        tee.attach(scene)
+        if attach:
+            attach(scene)
+        try:
+            scene.render()
+        except BaseException:
+            tee.abort()
+            raise
+        clip = str(scene.renderer.file_writer.movie_file_path)
+    outputs = tee.close()
+    if job.cache_key:
+        section_cache.store_clip(info, job.cache_key, clip)
+        for output in job.outputs:
+            section_cache.store_clip(info, section_cache.output_key(job.cache_key, output),
+                                     outputs[output.name], output.suffix)
+    return SectionResult(job.section, job.index, clip, resolution, time.perf_counter() - start,
+                         outputs=outputs)
+
+
+def concat_clips(clips, output, join=COPY_JOIN):
+    """Join ``clips`` into ``output`` with ffmpeg's concat demuxer, no re-encode.
+
+    ``join`` replaces the stream-copy arguments for formats that need them.
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg is required to join section clips")
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for clip in clips:
+            escaped = Path(clip).resolve().as_posix().replace("'", r"'\''")
+            listing.write(f"file '{escaped}'\n")
+    try:
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", listing.name, *join, str(output)],
+            check=True,
+        )
+    finally:
+        os.unlink(listing.name)
+    return output
+
+
+def section_jobs(info, sections=None, quality=None, ladder=(), formats=()):
+    """One job per selected section.
+
+    ``ladder`` adds downscaled rungs (heights) and ``formats`` other codecs
+    (keys of :data:`tools.tee.FORMATS`), all encoded from the same frames.
+    """
+    selected = sections or info.sections
+    unknown = set(selected) - set(info.sections)
+    if unknown:
+        raise KeyError(f"{info.name} has no section(s): {', '.join(sorted(unknown))}")
+    settings = info.render_config(quality)
+    outputs = tuple(ladder_outputs(settings, ladder)) + tuple(FORMATS[name] for name in formats)
+    return [
+        SectionJob(info.name, str(info.path), index, section, settings,
+                   section_cache.section_key(info, section, settings), outputs)
+        for index, section in enumerate(info.sections)
+        if section in selected
+    ]
+
+
+def split_cached(info, jobs, force=False):
+    """Return ``(results reused from the section cache, jobs left to render)``."""
+    if force:
+        return [], jobs
+    reused, pending = [], []
+    for job in jobs:
+        clip = section_cache.cached_clip(info, job.cache_key)
+        outputs = {
+            output.name: section_cache.cached_clip(info, section_cache.output_key(job.cache_key, output),
+                                                   output.suffix)
+            for output in job.outputs
+        }
+        if clip is None or None in outputs.values():
+            pending.append(job)
+        else:
+            reused.append(SectionResult(job.section, job.index, str(clip), quality_dir(job.config), 0.0,
+                                        cached=True, outputs={k: str(v) for k, v in outputs.items()}))
+    return reused, pending
+
+
+def run_jobs(jobs, workers=None):
+    """Render ``jobs`` on a process pool, yielding results in job order."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(render_section, jobs)
+
+
+def output_path(info, quality_dir, name=None, suffix=".mp4"):
+    return info.directory / "media" / "videos" / quality_dir / f"{name or info.output_file}{suffix}"
+
+
+def join_outputs(info, outputs, results, name=None):
+    """Join the extra encodes of ``results`` (in order); ``{output name: video}``."""
+    return {
+        output.name: concat_clips([r.outputs[output.name] for r in results],
+                                  output_path(info, output.name, name, output.suffix), output.join)
+        for output in outputs
+    }
+
+
+def render_scene(info, sections=None, quality=None, workers=None, output=None, force=False,
+                 ladder=(), formats=()):
+    """Render ``info`` in parallel and return the path of the joined video."""
+    jobs = section_jobs(info, sections, quality, ladder, formats)
+    reused, pending = split_cached(info, jobs, force)
+    if pending:
+        precompile([info], workers)
+    results = sorted(reused + list(run_jobs(pending, workers)), key=lambda r: r.index)
+    for result in results:
+        timing = "cached" if result.cached else f"{result.wall_time:6.1f}s"
+        print(f"  {result.section:<40} {timing:>7}")
+    movie = output_path(info, results[0].quality_dir, output)
+    concat_clips([r.clip for r in results], movie)
+    for path in join_outputs(info, jobs[0].outputs, results, output).values():
+        print(f"  + {path}")
+    return movie
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scene", help="scene class name, e.g. BERTBreakthrough")
+    parser.add_argument("--sections", nargs="+", help="only render these sections")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), help="override the script's quality")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("-o", "--output", help="name of the joined video (default: the script's output_file)")
+    parser.add_argument("--force", action="store_true", help="re-render sections even if they are cached")
+    parser.add_argument("--ladder", nargs="+", type=int, default=(), metavar="HEIGHT",
+                        help="also encode these lower resolutions (e.g. 720 480) from the same frames")
+    parser.add_argument("--formats", nargs="+", choices=sorted(FORMATS), default=(),
+                        help="also encode these formats from the same frames")
+    args = parser.parse_args(argv)
+
+    info = find_scene(args.scene)
+    start = time.perf_counter()
+    print(f"Rendering {info.name} on {args.jobs} workers")
+    movie = render_scene(info, args.sections, args.quality, args.jobs, args.output, args.force,
+                         args.ladder, args.formats)
+    print(f"{movie} ready in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""Discovery of the paper scenes and the sections they are built from.
+
+Every ``main.py`` in the repository defines one ``Scene`` whose ``construct``
+is a flat list of ``self.<section>()`` calls, and every section starts from an
+empty screen.  The helpers below read that structure straight from the source
+with ``ast`` so they can be used without importing manim.
+"""
+
+import ast
+import importlib.util
+import inspect
+import re
+import textwrap
+from dataclasses import dataclass, field
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Keys from a script's ``__main__`` block that only make sense for an
+# interactive single-file run.
+INTERACTIVE_CONFIG_KEYS = {"preview", "output_file"}
+
+QUALITY_FLAGS = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+@dataclass
+class SceneInfo:
+    """A scene class found in one of the paper directories."""
+    name: str
+    path: Path
+    sections: list
+    config: list = field(default_factory=list)
+    output_file: str = ""
+
+    @property
+    def directory(self):
+        return self.path.parent
+
+    def render_config(self, quality=None):
+        """Config assignments to replay before rendering, in source order."""
+        settings = [(k, v) for k, v in self.config if k not in INTERACTIVE_CONFIG_KEYS]
+        if quality:
+            settings.append(("quality", QUALITY_FLAGS.get(quality, quality)))
+        return settings
+
+
+def _is_scene_class(node):
+    return any(
+        (isinstance(base, ast.Name) and base.id.endswith("Scene"))
+        or (isinstance(base, ast.Attribute) and base.attr.endswith("Scene"))
+        for base in node.bases
+    )
+
+
+def _is_main_guard(node):
+    test = getattr(node, "test", None)
+    return (
+        isinstance(node, ast.If)
+        and isinstance(test, ast.Compare)
+        and isinstance(test.left, ast.Name)
+        and test.left.id == "__name__"
+    )
+
+
+def _config_assignments(statements):
+    """Yield ``(key, value)`` for every literal ``config.key = value``."""
+    for stmt in statements:
+        if not isinstance(stmt, ast.Assign) or len(stmt.targets) != 1:
+            continue
+        target = stmt.targets[0]
+        if (
+            isinstance(target, ast.Attribute)
+            and isinstance(target.value, ast.Name)
+            and target.value.id == "config"
+        ):
+            try:
+                yield target.attr, ast.literal_eval(stmt.value)
+            except ValueError:
+                continue
+
+
+def section_calls(class_node):
+    """Names of the methods ``construct`` calls, in call order."""
+    methods = {n.name: n for n in class_node.body if isinstance(n, ast.FunctionDef)}
+    construct = methods.get("construct")
+    if construct is None:
+        return []
+    sections = []
+    for stmt in construct.body:
+        call = getattr(stmt, "value", None)
+        if not (isinstance(stmt, ast.Expr) and isinstance(call, ast.Call)):
+            continue
+        func = call.func
+        if (
+            isinstance(func, ast.Attribute)
+            and isinstance(func.value, ast.Name)
+            and func.value.id == "self"
+            and func.attr in methods
+            and func.attr != "construct"
+        ):
+            sections.append(func.attr)
+    return sections
+
+
+def parse_scene_file(path):
+    """Return a :class:`SceneInfo` for every scene defined in ``path``."""
+    path = Path(path)
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    config = list(_config_assignments(tree.body))
+    for node in tree.body:
+        if _is_main_guard(node):
+            config.extend(_config_assignments(node.body))
+    output_file = dict(config).get("output_file", "")
+    return [
+        SceneInfo(node.name, path, section_calls(node), config, output_file or node.name)
+        for node in tree.body
+        if isinstance(node, ast.ClassDef) and _is_scene_class(node) and section_calls(node)
+    ]
+
+
+def discover_scenes(root=REPO_ROOT):
+    """All scenes in the ``*/main.py`` scripts under ``root``."""
+    scenes = []
+    for path in sorted(Path(root).glob("*/main.py")):
+        scenes.extend(parse_scene_file(path))
+    return scenes
+
+
+def find_scene(name, root=REPO_ROOT):
+    for info in discover_scenes(root):
+        if info.name == name:
+            return info
+    available = ", ".join(info.name for info in discover_scenes(root))
+    raise KeyError(f"No scene named {name!r}. Available scenes: {available}")
+
+
+def load_scene_class(info):
+    """Import the script behind ``info`` and return its scene class.
+
+    The scripts live in directories whose names contain spaces and are all
+    called ``main.py``, so they are loaded by path under a unique module name.
+    """
+    module_name = "scene_" + re.sub(r"\W+", "_", info.directory.name).strip("_").lower()
+    spec = importlib.util.spec_from_file_location(module_name, info.path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, info.name)
+
+
+def section_scene(scene_cls, sections):
+    """Subclass of ``scene_cls`` whose ``construct`` only plays ``sections``.
+
+    The original ``construct`` still runs, so any setup it does (such as the
+    background colour) is kept; every other section becomes a no-op.  The
+    name of the section being played is exposed as ``current_section``.
+    """
+    wanted = set(sections)
+    namespace = {"current_section": None}
+
+    def skipped(self):
+        pass
+
+    def tracked(name):
+        method = getattr(scene_cls, name)
+
+        def run(self):
+            self.current_section = name
+            try:
+                method(self)
+            finally:
+                self.current_section = None
+        run.__name__ = name
+        return run
+
+    tree = ast.parse(_class_source(scene_cls))
+    for name in section_calls(tree.body[0]):
+        namespace[name] = tracked(name) if name in wanted else skipped
+    return type(scene_cls.__name__, (scene_cls,), namespace)
+
+
+def _class_source(scene_cls):
+    return textwrap.dedent(inspect.getsource(scene_cls))
+
+
+# Resolution and frame rate for each ``config.quality`` name.
+QUALITY_SETTINGS = {
+    "low_quality": (854, 480, 15),
+    "medium_quality": (1280, 720, 30),
+    "high_quality": (1920, 1080, 60),
+    "production_quality": (2560, 1440, 60),
+    "fourk_quality": (3840, 2160, 60),
+}
+
+
+def video_settings(settings):
+    """``(width, height, fps)`` after replaying ``settings`` on manim's defaults."""
+    width, height, fps = QUALITY_SETTINGS["high_quality"]
+    for key, value in settings:
+        if key == "quality":
+            width, height, fps = QUALITY_SETTINGS[value]
+        elif key == "pixel_width":
+            width = value
+        elif key == "pixel_height":
+            height = value
+        elif key == "frame_rate":
+            fps = value
+    return width, height, fps
+
+
+def quality_dir(settings):
+    """Directory name manim uses for a resolution, e.g. ``1080p60``."""
+    _, height, fps = video_settings(settings)
+    return f"{height}p{fps:g}"
+
+
+def _literal_number(node, default):
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        return default
+    return value if isinstance(value, (int, float)) else default
+
+
+def _loop_count(node, default=4):
+    """Best guess at how many times a ``for`` loop body runs."""
+    iterable = node.iter
+    if isinstance(iterable, (ast.List, ast.Tuple)):
+        return len(iterable.elts)
+    if isinstance(iterable, ast.Call) and getattr(iterable.func, "id", None) == "range":
+        args = [_literal_number(a, None) for a in iterable.args]
+        if args and None not in args:
+            return len(range(*[int(a) for a in args]))
+    return default
+
+
+def _estimate_block(statements, methods, seen):
+    seconds = 0.0
+    for stmt in statements:
+        if isinstance(stmt, (ast.For, ast.While)):
+            seconds += _loop_count(stmt) * _estimate_block(stmt.body, methods, seen)
+            continue
+        for node in ast.walk(stmt):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+                continue
+            if not (isinstance(node.func.value, ast.Name) and node.func.value.id == "self"):
+                continue
+            name = node.func.attr
+            if name == "wait":
+                seconds += _literal_number(node.args[0], 1.0) if node.args else 1.0
+            elif name == "play":
+                run_time = next((k.value for k in node.keywords if k.arg == "run_time"), None)
+                seconds += _literal_number(run_time, 1.0) if run_time is not None else 1.0
+            elif name in methods and name not in seen:
+                seconds += _estimate_block(methods[name].body, methods, seen | {name})
+    return seconds
+
+
+def estimate_duration(info, section):
+    """Rough length in seconds of ``section``, read from its play/wait calls.
+
+    Only meant for ordering work; loops over non-literal iterables are
+    assumed to run a handful of times.
+    """
+    tree = ast.parse(info.path.read_text(encoding="utf-8"))
+    class_node = next(n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == info.name)
+    methods = {n.name: n for n in class_node.body if isinstance(n, ast.FunctionDef)}
+    return _estimate_block(methods[section].body, methods, {section})
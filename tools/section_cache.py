@@ -0,0 +1,198 @@
+"""Skip sections whose inputs have not changed since their last render.
+
+manim's own cache hashes every ``play`` call, which means it still has to
+build all of a section's mobjects before it can tell that nothing changed.
+This cache works one level up and never imports the scene: a section's key is
+a hash of
+
+* the section method and every ``self.<helper>()`` it (transitively) calls,
+* the setup part of ``construct`` (e.g. the background colour),
+* the module-level constants, classes and functions those reference
+  (``META_BLUE``, ``DEEPSEEK_TEAL``, ``ManimBrain`` ...),
+* any repository-local packages the script imports,
+* data files named by those constants (paths or glob patterns relative to
+  the script, such as a training log), by content,
+* the render config and the installed manim version.
+
+Code is compared by its AST, so comment and formatting edits do not
+invalidate a clip.  Clips are stored content-addressed under
+``<paper>/media/sections/<Scene>/cache/<key>.mp4``, next to any extra
+encodes of the same render.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import shutil
+from importlib import metadata
+from pathlib import Path
+
+from components.data import file_digest
+from tools.scenes import REPO_ROOT
+
+
+def _manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _loaded_names(nodes):
+    return {
+        node.id
+        for tree in nodes
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)
+    }
+
+
+def _self_calls(node):
+    return {
+        call.func.attr
+        for call in ast.walk(node)
+        if isinstance(call, ast.Call)
+        and isinstance(call.func, ast.Attribute)
+        and isinstance(call.func.value, ast.Name)
+        and call.func.value.id == "self"
+    }
+
+
+def _module_definitions(tree):
+    """Map each module-level name to the statement that defines it."""
+    definitions = {}
+    for stmt in tree.body:
+        if isinstance(stmt, (ast.ClassDef, ast.FunctionDef)):
+            definitions[stmt.name] = stmt
+        elif isinstance(stmt, ast.Assign):
+            for target in stmt.targets:
+                if isinstance(target, ast.Name):
+                    definitions[target.id] = stmt
+    return definitions
+
+
+def _local_packages(tree):
+    """Repository-local packages imported by the script, e.g. ``components``."""
+    packages = set()
+    for stmt in tree.body:
+        if isinstance(stmt, ast.ImportFrom) and stmt.module:
+            packages.add(stmt.module.split(".")[0])
+        elif isinstance(stmt, ast.Import):
+            packages.update(alias.name.split(".")[0] for alias in stmt.names)
+    return sorted(p for p in packages if (REPO_ROOT / p / "__init__.py").exists())
+
+
+def _package_digest(package):
+    digest = hashlib.sha256()
+    for path in sorted((REPO_ROOT / package).rglob("*.py")):
+        digest.update(path.relative_to(REPO_ROOT).as_posix().encode())
+        digest.update(ast.dump(ast.parse(path.read_bytes())).encode())
+    return digest.hexdigest()
+
+
+def _data_files(info, name):
+    """Files a string constant names, relative to the script; usually none."""
+    if not name or any(c.isspace() for c in name):
+        return []
+    try:
+        if any(c in name for c in "*?["):
+            return sorted(p for p in info.directory.glob(name) if p.is_file())
+        path = info.directory / name
+        return [path] if path.is_file() else []
+    except (OSError, ValueError, NotImplementedError):
+        return []
+
+
+def _data_digest(info, nodes):
+    """Hash of the files that string constants in module-level assignments name."""
+    digest = hashlib.sha256()
+    for name in sorted({
+        node.value
+        for stmt in nodes if isinstance(stmt, ast.Assign)
+        for node in ast.walk(stmt)
+        if isinstance(node, ast.Constant) and isinstance(node.value, str)
+    }):
+        for path in _data_files(info, name):
+            digest.update(path.relative_to(info.directory).as_posix().encode())
+            digest.update(file_digest(path).encode())
+    return digest.hexdigest()
+
+
+def section_inputs(info, section):
+    """The AST fragments a section's output depends on, in a stable order."""
+    tree = ast.parse(info.path.read_text(encoding="utf-8"))
+    class_node = next(n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == info.name)
+    methods = {n.name: n for n in class_node.body if isinstance(n, ast.FunctionDef)}
+
+    # The section plus every helper method reachable from it.
+    used, pending = [], [section]
+    while pending:
+        name = pending.pop()
+        if name in used or name not in methods:
+            continue
+        used.append(name)
+        pending.extend(sorted(_self_calls(methods[name]) - set(info.sections)))
+    nodes = [methods[name] for name in sorted(used)]
+
+    # construct() minus its docstring and the calls into the sections.
+    construct = methods["construct"]
+    nodes.extend(
+        stmt for stmt in construct.body
+        if not (_self_calls(stmt) & set(info.sections))
+        and not (isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant))
+    )
+
+    # Module-level definitions, following references between them.
+    definitions = _module_definitions(tree)
+    seen, pending = set(), sorted(_loaded_names(nodes) & definitions.keys())
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        pending.extend(sorted((_loaded_names([definitions[name]]) & definitions.keys()) - seen))
+    globals_ = [definitions[name] for name in sorted(seen)]
+    return nodes + globals_, _local_packages(tree)
+
+
+def section_key(info, section, settings):
+    """Hex digest identifying everything that determines a section's clip."""
+    nodes, packages = section_inputs(info, section)
+    digest = hashlib.sha256()
+    for node in nodes:
+        digest.update(ast.dump(node).encode())
+    for package in packages:
+        digest.update(_package_digest(package).encode())
+    digest.update(_data_digest(info, nodes).encode())
+    digest.update(json.dumps([info.name, section, settings, _manim_version()], default=str).encode())
+    return digest.hexdigest()[:32]
+
+
+def cache_dir(info):
+    return info.directory / "media" / "sections" / info.name / "cache"
+
+
+def output_key(key, output):
+    """Key of an extra encode (see :mod:`tools.tee`) of the clip stored under ``key``."""
+    return hashlib.sha256(f"{key}:{output!r}".encode()).hexdigest()[:32]
+
+
+def cached_clip(info, key, suffix=".mp4"):
+    path = cache_dir(info) / f"{key}{suffix}"
+    return path if path.exists() else None
+
+
+def store_clip(info, key, clip, suffix=".mp4"):
+    """Record a copy of ``clip`` under ``key``.
+
+    A copy, not a link: the next render of the section rewrites ``clip`` in
+    place, which would change the entry of the old key too.
+    """
+    target = cache_dir(info) / f"{key}{suffix}"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per process: workers may store the same key concurrently.
+    partial = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    shutil.copyfile(clip, partial)
+    os.replace(partial, target)
+    return Path(target)
@@ -0,0 +1,115 @@
+"""Storyboard: the end state of every ``self.play``, tiled into one PNG per section.
+
+For layout review only the final frame of each play matters.  The scene is
+run with manim's animation skipping (each play is evaluated once, at its end
+time) and as a dry run (nothing is encoded or written), ``self.wait`` is a
+no-op, and the frame left in the camera after each play is collected.  Each
+section's frames are tiled into a contact sheet under
+``<paper>/media/storyboards/<Scene>/``::
+
+    python -m tools.storyboard DeepSeekR1Animation
+    python -m tools.storyboard FaithfulnessAnimation --sections scene2_hint_experiment -q m
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from tools.render import configured_scene
+from tools.scenes import QUALITY_FLAGS, discover_scenes, find_scene, section_scene
+
+COLUMNS = 4
+THUMB_WIDTH = 480
+CAPTION_HEIGHT = 24
+MARGIN = 8
+
+
+class Storyboard:
+    """Collects the end-of-play frame of an attached scene, per section."""
+
+    def __init__(self):
+        self.frames = {}
+
+    def attach(self, scene):
+        from PIL import Image
+
+        renderer = scene.renderer
+        play = scene.play
+
+        def captured_play(*args, **kwargs):
+            play(*args, **kwargs)
+            caption = ", ".join(type(a).__name__ for a in scene.animations or [])
+            image = Image.fromarray(renderer.get_frame()).convert("RGB")
+            self.frames.setdefault(scene.current_section, []).append((caption, image))
+
+        def skipped_wait(*args, **kwargs):
+            pass
+
+        scene.play = captured_play
+        scene.wait = skipped_wait
+        return scene
+
+
+def contact_sheet(frames, title, columns=COLUMNS, thumb_width=THUMB_WIDTH):
+    """Tile ``(caption, image)`` pairs into one image, numbered in play order."""
+    from PIL import Image, ImageDraw
+
+    width, height = frames[0][1].size
+    thumb_height = round(height * thumb_width / width)
+    rows = -(-len(frames) // columns)
+    cell_w, cell_h = thumb_width + MARGIN, thumb_height + CAPTION_HEIGHT + MARGIN
+    sheet = Image.new("RGB", (columns * cell_w + MARGIN, rows * cell_h + CAPTION_HEIGHT + MARGIN), "white")
+    draw = ImageDraw.Draw(sheet)
+    draw.text((MARGIN, MARGIN // 2), title, fill="black")
+    for i, (caption, image) in enumerate(frames):
+        x = MARGIN + (i % columns) * cell_w
+        y = CAPTION_HEIGHT + MARGIN + (i // columns) * cell_h
+        sheet.paste(image.resize((thumb_width, thumb_height), Image.LANCZOS), (x, y))
+        draw.text((x, y + thumb_height + 4), f"#{i + 1} {caption}"[:70], fill="black")
+    return sheet
+
+
+def storyboard_scene(info, sections=None, quality="l", output_dir=None):
+    """Write one contact sheet per section of ``info``; return their paths."""
+    settings = info.render_config(quality)
+    storyboard = Storyboard()
+    with configured_scene(info, settings, dry_run=True, disable_caching=True) as scene_cls:
+        scene = section_scene(scene_cls, sections or info.sections)(skip_animations=True)
+        storyboard.attach(scene)
+        scene.render()
+
+    output_dir = Path(output_dir or info.directory / "media" / "storyboards" / info.name)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    sheets = []
+    for index, section in enumerate(info.sections):
+        frames = storyboard.frames.get(section)
+        if not frames:
+            continue
+        path = output_dir / f"{index:02d}_{section}.png"
+        contact_sheet(frames, f"{info.name}.{section}").save(path)
+        sheets.append(path)
+    return sheets
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all scenes)")
+    parser.add_argument("--sections", nargs="+", help="only these sections")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), default="l",
+                        help="resolution the frames are rasterised at (default: l)")
+    parser.add_argument("-o", "--output-dir", help="where to write the sheets (single scene only)")
+    args = parser.parse_args(argv)
+
+    scenes = [find_scene(name) for name in args.scenes] if args.scenes else discover_scenes()
+    if args.output_dir and len(scenes) > 1:
+        parser.error("--output-dir needs exactly one scene")
+    for info in scenes:
+        start = time.perf_counter()
+        sheets = storyboard_scene(info, args.sections, args.quality, args.output_dir)
+        print(f"{info.name}: {len(sheets)} sheet(s) in {time.perf_counter() - start:.1f}s")
+        for path in sheets:
+            print(f"  {path}")
+
+
+if __name__ == "__main__":
+    main()
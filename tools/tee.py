@@ -0,0 +1,139 @@
+"""Feed a render's rasterised frames to extra encoders in the same pass.
+
+manim encodes the master video itself.  A :class:`FrameTee` attached to a
+scene also pipes every frame the renderer produces, as raw RGBA, into one
+ffmpeg process whose filter graph splits the stream into several
+:class:`TeeOutput` encodes: downscaled rungs (:func:`ladder_outputs`) and
+other codecs (:data:`FORMATS`: VP9 and AV1 WebM, a palette-optimised GIF
+preview).  Cairo draws each frame once, however many outputs there are.
+
+The tee sees frames as the renderer hands them over, so manim's own
+per-play cache has to be off while it is attached (a cached play produces
+no frames); :func:`tools.render.render_section` does that.
+"""
+
+import shutil
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+H264_ARGS = ("-c:v", "libx264", "-preset", "medium", "-crf", "20", "-pix_fmt", "yuv420p",
+             "-movflags", "+faststart")
+
+# How section clips of an output are joined (ffmpeg arguments after the
+# concat input): a stream copy unless the format cannot be copied.
+COPY_JOIN = ("-c", "copy", "-movflags", "+faststart")
+
+GIF_PREVIEW_SECONDS = 20
+
+
+@dataclass(frozen=True)
+class TeeOutput:
+    """One extra encode of the frame stream.
+
+    ``filters`` is an ffmpeg filter graph fragment applied to the master
+    frames (``{id}`` is replaced by a prefix unique to the output, for
+    internal labels), ``codec`` the encoder arguments and ``join`` the
+    arguments used to join the section clips; ``name`` doubles as the media
+    sub-directory the clips and the joined video are written to.
+    """
+    name: str
+    filters: str
+    codec: tuple = H264_ARGS
+    suffix: str = ".mp4"
+    join: tuple = COPY_JOIN
+
+    def graph(self, source, sink):
+        return f"[{source}]{self.filters.format(id=sink)}[{sink}]"
+
+
+# Palette-optimised GIF: one palette per clip, built from the clip's own
+# frames.  Section GIFs have different palettes, so the joined preview is
+# re-quantised (from the decoded GIFs, not re-rendered) and capped in length.
+_GIF_PALETTE = "split[{id}a][{id}b];[{id}a]palettegen=stats_mode=diff[{id}p];[{id}b][{id}p]paletteuse=dither=bayer:bayer_scale=4"
+
+# Extra codecs of the master resolution, selected with ``--formats``.
+FORMATS = {
+    "webm": TeeOutput("webm", "format=yuv420p", (
+        "-c:v", "libvpx-vp9", "-crf", "32", "-b:v", "0", "-row-mt", "1", "-deadline", "good", "-cpu-used", "4",
+    ), ".webm", ("-c", "copy")),
+    "av1": TeeOutput("av1", "format=yuv420p", (
+        "-c:v", "libsvtav1", "-crf", "35", "-preset", "8",
+    ), ".webm", ("-c", "copy")),
+    "gif": TeeOutput("gif", "fps=12,scale=480:-2:flags=lanczos," + _GIF_PALETTE, (
+        "-loop", "0",
+    ), ".gif", (
+        "-t", str(GIF_PREVIEW_SECONDS), "-filter_complex", "[0:v]" + _GIF_PALETTE.format(id="g"), "-loop", "0",
+    )),
+}
+
+
+def ladder_outputs(settings, heights):
+    """Downscaled H.264 rungs of the master resolution, named like ``720p60``."""
+    from tools.scenes import video_settings
+
+    _, master_height, fps = video_settings(settings)
+    return [
+        TeeOutput(f"{height}p{fps:g}", f"scale=-2:{height}:flags=lanczos")
+        for height in sorted(set(heights), reverse=True)
+        if height < master_height
+    ]
+
+
+class FrameTee:
+    """Pipes an attached scene's frames into one ffmpeg process per section."""
+
+    def __init__(self, outputs, paths):
+        self.outputs = list(outputs)
+        self.paths = [Path(path) for path in paths]
+        self._process = None
+
+    def _start(self, width, height, fps):
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError("ffmpeg is required for extra outputs")
+        sources = [f"s{i}" for i in range(len(self.outputs))]
+        graph = [f"[0:v]split={len(sources)}" + "".join(f"[{s}]" for s in sources)]
+        graph += [output.graph(source, f"o{i}") for i, (output, source) in enumerate(zip(self.outputs, sources))]
+        command = [ffmpeg, "-y", "-loglevel", "error",
+                   "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", f"{fps:g}", "-i", "-",
+                   "-filter_complex", ";".join(graph)]
+        for i, (output, path) in enumerate(zip(self.outputs, self.paths)):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            command += ["-map", f"[o{i}]", *output.codec, str(path)]
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def attach(self, scene):
+        """Copy every frame ``scene``'s renderer adds to the video into the tee."""
+        if not self.outputs:
+            return scene
+        renderer = scene.renderer
+        camera = renderer.camera
+        add_frame = renderer.add_frame
+
+        def teed_add_frame(frame, num_frames=1):
+            if not renderer.skip_animations:
+                if self._process is None:
+                    self._start(camera.pixel_width, camera.pixel_height, camera.frame_rate)
+                data = frame.data
+                for _ in range(num_frames):
+                    self._process.stdin.write(data)
+            return add_frame(frame, num_frames)
+        renderer.add_frame = teed_add_frame
+        return scene
+
+    def abort(self):
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+
+    def close(self):
+        """Finish the encodes; returns ``{output name: clip}``."""
+        if self._process is None:
+            return {}
+        self._process.stdin.close()
+        if self._process.wait():
+            raise RuntimeError(f"ffmpeg exited with status {self._process.returncode} "
+                               f"while writing {', '.join(map(str, self.paths))}")
+        return {output.name: str(path) for output, path in zip(self.outputs, self.paths)}
@@ -0,0 +1,162 @@
+"""Compile every scene's LaTeX up front, in parallel, into one shared cache.
+
+``MathTex``/``Tex`` run LaTeX and dvisvgm the first time an expression is
+built.  This module finds the TeX mobjects with literal arguments in every
+paper's ``main.py`` and builds them on a process pool with manim's
+``tex_dir`` pointed at ``.cache/tex``.  manim names the ``.tex``/``.svg``
+files after a hash of the complete TeX source, so the directory is a
+content-addressed store shared by all papers; render workers use the same
+directory (see :func:`tools.render.configured_scene`) and find every SVG
+already there.  ``manifest.json`` records which SVG each expression
+compiled to, so a warm cache is recognised without starting a pool or
+importing manim::
+
+    python -m tools.tex_cache            # all scenes
+    python -m tools.tex_cache GPTPaperAnimation -j 4
+
+``tools.render`` and ``tools.build_all`` run this before scheduling sections.
+"""
+
+import argparse
+import ast
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from importlib import metadata
+
+from tools.scenes import REPO_ROOT, discover_scenes, find_scene
+
+TEX_DIR = REPO_ROOT / ".cache" / "tex"
+MANIFEST = TEX_DIR / "manifest.json"
+
+TEX_CLASSES = {"MathTex", "Tex", "SingleStringMathTex"}
+
+# Keyword arguments that change the generated TeX source.  Styling arguments
+# (colour, font size, ...) are applied after compilation and are ignored.
+TEX_KEYWORDS = {"arg_separator", "substrings_to_isolate", "tex_environment"}
+
+
+def _hashable(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+def tex_expressions(info):
+    """``(class name, args, kwargs)`` for each literal TeX mobject in ``info``'s file.
+
+    Calls with a non-literal string or TeX-affecting keyword (an f-string, a
+    ``tex_to_color_map``, a custom template) are skipped; they still compile
+    during the render as before.
+    """
+    tree = ast.parse(info.path.read_text(encoding="utf-8"), filename=str(info.path))
+    found = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                and node.func.id in TEX_CLASSES):
+            continue
+        if any(kw.arg is None or kw.arg in {"tex_template", "tex_to_color_map"} for kw in node.keywords):
+            continue
+        try:
+            args = tuple(ast.literal_eval(arg) for arg in node.args)
+            kwargs = tuple(sorted(
+                (kw.arg, _hashable(ast.literal_eval(kw.value)))
+                for kw in node.keywords if kw.arg in TEX_KEYWORDS
+            ))
+        except ValueError:
+            continue
+        if args and all(isinstance(arg, str) for arg in args):
+            found.append((node.func.id, args, kwargs))
+    return found
+
+
+def _compile(expression):
+    """Build one TeX mobject so its SVG lands in the shared cache.  Runs inside a worker.
+
+    Returns the seconds it took and the name of the SVG (manim's hash of the
+    generated ``.tex`` file).
+    """
+    import manim
+    from manim import tempconfig
+
+    class_name, args, kwargs = expression
+    start = time.perf_counter()
+    # Intermediate files are left alone here: manim's cleanup deletes every
+    # non-SVG file in tex_dir, including other workers' in-flight DVIs.
+    with tempconfig({"tex_dir": str(TEX_DIR), "no_latex_cleanup": True}):
+        mobject = getattr(manim, class_name)(*args, **dict(kwargs))
+    svg = getattr(mobject, "file_name", None)
+    return time.perf_counter() - start, svg and os.path.basename(svg)
+
+
+def _manifest_key(expression):
+    # The TeX template, and so the hash, can change with the manim version.
+    try:
+        version = metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return json.dumps([version, *expression])
+
+
+def _read_manifest():
+    try:
+        return json.loads(MANIFEST.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _is_compiled(manifest, expression):
+    svg = manifest.get(_manifest_key(expression))
+    return bool(svg) and (TEX_DIR / svg).exists()
+
+
+def clean_intermediates(tex_dir=TEX_DIR):
+    """Remove LaTeX by-products, keeping the ``.tex`` sources, SVGs and the manifest."""
+    if not tex_dir.is_dir():
+        return
+    for path in tex_dir.iterdir():
+        if path.suffix not in {".svg", ".tex"} and not path.name.startswith(MANIFEST.name):
+            path.unlink(missing_ok=True)
+
+
+def precompile(scenes, workers=None, verbose=False):
+    """Compile the TeX of ``scenes`` that is not cached yet; return the number of expressions."""
+    expressions = sorted({expression for info in scenes for expression in tex_expressions(info)})
+    manifest = _read_manifest()
+    missing = [expression for expression in expressions if not _is_compiled(manifest, expression)]
+    if not missing:
+        return len(expressions)
+    TEX_DIR.mkdir(parents=True, exist_ok=True)
+    workers = min(workers or os.cpu_count() or 1, len(missing))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_compile, expression): expression for expression in missing}
+        for future in as_completed(futures):
+            seconds, svg = future.result()
+            if svg:
+                manifest[_manifest_key(futures[future])] = svg
+            if verbose:
+                _, args, _ = futures[future]
+                print(f"{seconds:6.2f}s  {' '.join(args)[:70]}")
+    clean_intermediates()
+    # Re-read: another build may have added entries meanwhile.
+    manifest = {**_read_manifest(), **manifest}
+    partial = MANIFEST.with_name(f"{MANIFEST.name}.{os.getpid()}.tmp")
+    partial.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(partial, MANIFEST)
+    return len(expressions)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all scenes)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    scenes = [find_scene(name) for name in args.scenes] if args.scenes else discover_scenes()
+    start = time.perf_counter()
+    count = precompile(scenes, args.workers, verbose=True)
+    print(f"{count} TeX expression(s) ready in {TEX_DIR.relative_to(REPO_ROOT)} "
+          f"({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
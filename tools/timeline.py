@@ -0,0 +1,178 @@
+"""Timeline of a scene: when every play and wait starts, how long it runs, in frames.
+
+The scene is constructed with manim's animation skipping and a dry run, and
+nothing is rasterised, so run times are evaluated exactly as in a render
+(``run_time``, ``LaggedStart`` lag ratios, ``wait`` durations) without
+drawing a frame.  Frame counts follow the renderer: ``ceil(run_time * fps)``
+for an animation and ``int(duration * fps)`` for a static wait.  A table is
+printed and a JSON report is written to ``<paper>/media/timelines/``; its
+per-section durations replace the source-based estimate when
+:mod:`tools.build_all` orders sections it has never built::
+
+    python -m tools.timeline DeepSeekR1Animation
+    python -m tools.timeline -q h --plays      # every scene, with one row per call
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+
+from tools.render import configured_scene, skip_rasterisation
+from tools.scenes import QUALITY_FLAGS, REPO_ROOT, discover_scenes, find_scene, section_scene
+
+
+def frame_count(duration, fps, static_wait=False):
+    """Frames the renderer writes for a call of ``duration`` seconds."""
+    step = 1 / fps
+    if static_wait:
+        return int(duration / step)
+    # Length of the renderer's np.arange(0, run_time, step).
+    return max(math.ceil(duration / step), 0)
+
+
+class Timeline:
+    """Records start, duration and frames of every ``play``/``wait`` of an attached scene."""
+
+    def __init__(self):
+        self.calls = []
+        self._depth = 0
+
+    def attach(self, scene):
+        renderer = scene.renderer
+        skip_rasterisation(renderer)
+        fps = renderer.camera.frame_rate
+        self._wrap_call(scene, "play", fps)
+        self._wrap_call(scene, "wait", fps)
+        return scene
+
+    def _wrap_call(self, scene, kind, fps):
+        original = getattr(scene, kind)
+        renderer = scene.renderer
+
+        def timed(*args, **kwargs):
+            if self._depth:
+                # wait() is implemented with play(); only record the outer call.
+                return original(*args, **kwargs)
+            caller = sys._getframe(1)
+            self._depth += 1
+            start = renderer.time
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self._depth -= 1
+                duration = renderer.time - start
+                animations = scene.animations or []
+                static = kind == "wait" and all(getattr(a, "is_static_wait", False) for a in animations)
+                path = Path(caller.f_code.co_filename)
+                self.calls.append({
+                    "index": len(self.calls),
+                    "section": getattr(scene, "current_section", None),
+                    "kind": kind,
+                    "animations": [type(a).__name__ for a in animations],
+                    "start": start,
+                    "duration": duration,
+                    "frames": frame_count(duration, fps, static),
+                    "line": f"{path.relative_to(REPO_ROOT) if path.is_relative_to(REPO_ROOT) else path}"
+                            f":{caller.f_lineno}",
+                })
+        setattr(scene, kind, timed)
+
+    def report(self, scene_name, settings, fps):
+        sections = {}
+        for call in self.calls:
+            section = sections.setdefault(call["section"] or "<construct>", {
+                "start": call["start"], "duration": 0.0, "frames": 0, "plays": 0, "waits": 0,
+            })
+            section["duration"] += call["duration"]
+            section["frames"] += call["frames"]
+            section["plays" if call["kind"] == "play" else "waits"] += 1
+        return {
+            "scene": scene_name,
+            "config": dict(settings),
+            "fps": fps,
+            "duration": sum(call["duration"] for call in self.calls),
+            "frames": sum(call["frames"] for call in self.calls),
+            "sections": sections,
+            "calls": self.calls,
+        }
+
+
+def _clock(seconds):
+    minutes, seconds = divmod(seconds, 60)
+    return f"{int(minutes)}:{seconds:05.2f}"
+
+
+def format_table(report, plays=False):
+    lines = [f"{report['scene']} @ {report['fps']:g} fps",
+             f"{'start':>8} {'length':>8} {'frames':>7}  section"]
+    for name, section in report["sections"].items():
+        lines.append(f"{_clock(section['start']):>8} {section['duration']:7.2f}s {section['frames']:7d}  "
+                     f"{name} ({section['plays']} plays, {section['waits']} waits)")
+        if plays:
+            for call in report["calls"]:
+                if (call["section"] or "<construct>") == name:
+                    what = ", ".join(call["animations"]) if call["kind"] == "play" else "wait"
+                    lines.append(f"{_clock(call['start']):>8} {call['duration']:7.2f}s {call['frames']:7d}"
+                                 f"      {what}  [{call['line']}]")
+    lines.append(f"{'total':>8} {report['duration']:7.2f}s {report['frames']:7d}")
+    return "\n".join(lines)
+
+
+def report_path(info):
+    return info.directory / "media" / "timelines" / f"{info.name}.json"
+
+
+def recorded_duration(info, section):
+    """``section``'s duration from ``info``'s last timeline report, or ``None``."""
+    try:
+        report = json.loads(report_path(info).read_text())
+    except (OSError, ValueError):
+        return None
+    found = report["sections"].get(section)
+    return found and found["duration"]
+
+
+def build_timeline(info, sections=None, quality=None):
+    """``info``'s timeline report, built without rendering."""
+    settings = info.render_config(quality)
+    timeline = Timeline()
+    with configured_scene(info, settings, dry_run=True, disable_caching=True) as scene_cls:
+        scene = section_scene(scene_cls, sections or info.sections)(skip_animations=True)
+        timeline.attach(scene)
+        scene.render()
+        return timeline.report(info.name, settings, scene.renderer.camera.frame_rate)
+
+
+def timeline_scene(info, sections=None, quality=None, output=None):
+    """Build ``info``'s timeline and write it; returns the report and its path."""
+    report = build_timeline(info, sections, quality)
+    output = Path(output or report_path(info))
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    return report, output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenes", nargs="*", help="scene class names (default: all scenes)")
+    parser.add_argument("--sections", nargs="+", help="only these sections")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), help="override the script's quality")
+    parser.add_argument("--plays", action="store_true", help="one row per play/wait call, too")
+    parser.add_argument("-o", "--output", help="report path (single scene only)")
+    args = parser.parse_args(argv)
+
+    scenes = [find_scene(name) for name in args.scenes] if args.scenes else discover_scenes()
+    if args.output and len(scenes) > 1:
+        parser.error("--output needs exactly one scene")
+    for info in scenes:
+        start = time.perf_counter()
+        report, path = timeline_scene(info, args.sections, args.quality, args.output)
+        print(format_table(report, args.plays))
+        print(f"built in {time.perf_counter() - start:.1f}s, report written to {path}\n")
+
+
+if __name__ == "__main__":
+    main()
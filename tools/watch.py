@@ -0,0 +1,125 @@
+"""Watch a scene script and re-render only the sections an edit changed.
+
+The script and the repository's ``components`` package are polled for
+saves.  After each save the section keys of :mod:`tools.section_cache` are
+recomputed (from the AST, without importing anything), so only sections
+whose method, helpers, constants or components actually changed are
+re-rendered; a comment or formatting edit re-renders nothing.  Changed
+sections are rendered at draft quality on a pool of workers that stay
+alive, with manim already imported, between edits, and every section's
+clip is joined into the preview video with a stream copy::
+
+    python -m tools.watch FaithfulnessAnimation
+    python -m tools.watch FaithfulnessAnimation --sections scene4_capability_vs_transparency
+
+The preview is written to ``<paper>/media/videos/<quality>/<output>_preview.mp4``.
+Stop with Ctrl-C.
+"""
+
+import argparse
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from tools.render import concat_clips, output_path, render_section, section_jobs, split_cached
+from tools.scenes import QUALITY_FLAGS, REPO_ROOT, find_scene, parse_scene_file
+from tools.tex_cache import precompile
+
+POLL_INTERVAL = 0.3
+
+
+def _warm_worker():
+    """Pool initializer: pay for manim's import before the first edit."""
+    import manim  # noqa: F401
+
+
+def watched_files(info):
+    return [info.path, *sorted((REPO_ROOT / "components").rglob("*.py"))]
+
+
+def _mtimes(paths):
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = path.stat().st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+class Watcher:
+    """Keeps ``info``'s preview video up to date with its source."""
+
+    def __init__(self, info, sections=None, quality="l", workers=None):
+        self.info = info
+        self.sections = sections
+        self.quality = quality
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker)
+        self.keys = {}
+
+    def reload(self):
+        """Re-parse the script; returns its jobs and the sections whose key changed."""
+        self.info = next(s for s in parse_scene_file(self.info.path) if s.name == self.info.name)
+        jobs = section_jobs(self.info, self.sections, self.quality)
+        return jobs, [job.section for job in jobs if self.keys.get(job.section) != job.cache_key]
+
+    def build(self, jobs):
+        """Render the jobs missing from the section cache and join the preview."""
+        reused, pending = split_cached(self.info, jobs)
+        if pending:
+            precompile([self.info])
+        results = sorted(reused + list(self.pool.map(render_section, pending)), key=lambda r: r.index)
+        for result in results:
+            if not result.cached:
+                print(f"  rendered {result.section} in {result.wall_time:.1f}s")
+        return concat_clips([r.clip for r in results],
+                            output_path(self.info, results[0].quality_dir, f"{self.info.output_file}_preview"))
+
+    def update(self):
+        start = time.perf_counter()
+        try:
+            jobs, changed = self.reload()
+            if not changed:
+                print("no section changed")
+                return
+            print(f"changed: {', '.join(changed)}")
+            preview = self.build(jobs)
+        except Exception:
+            # Typically a half-written edit; the next save retries every
+            # section that is not in the preview yet.
+            traceback.print_exc()
+            return
+        self.keys = {job.section: job.cache_key for job in jobs}
+        print(f"{preview} updated in {time.perf_counter() - start:.1f}s")
+
+    def run(self, interval=POLL_INTERVAL):
+        mtimes = _mtimes(watched_files(self.info))
+        self.update()
+        print(f"watching {self.info.path.relative_to(REPO_ROOT)} (Ctrl-C to stop)")
+        try:
+            while True:
+                time.sleep(interval)
+                current = _mtimes(watched_files(self.info))
+                if current != mtimes:
+                    mtimes = current
+                    self.update()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scene", help="scene class name, e.g. FaithfulnessAnimation")
+    parser.add_argument("--sections", nargs="+", help="only preview these sections")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), default="l",
+                        help="draft quality (default: l)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args(argv)
+    Watcher(find_scene(args.scene), args.sections, args.quality, args.jobs).run()
+
+
+if __name__ == "__main__":
+    main()